@@ -459,7 +459,7 @@ class PackageModeler(object):
         print "     --- Specifications ---"
         for bank_type in ROSModel.SPECIFICATION_TYPES:
             bank = self.ros_model[bank_type]
-            print "     {:4d}  items in {}".format(len(bank.keys),
+            print "     {:4d}  items in {}".format(len(bank),
                                                    ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type])
 
 
@@ -74,6 +74,13 @@ class _BankMetamodel(yaml.YAMLObject):
             self.names_to_metamodels[name] = self._create_entity(name)
         return self.names_to_metamodels[name]
 
+    def __len__(self):
+        """
+        Return number of entities in the bank
+        :return: number of entities
+        """
+        return len(self.names_to_metamodels)
+
     @property
     def keys(self):
         """
@@ -90,6 +97,14 @@ class _BankMetamodel(yaml.YAMLObject):
         """
         return self.names_to_metamodels.items()
 
+    @property
+    def values(self):
+        """
+        Return iterator over entities
+        :return: iterator over entity values
+        """
+        return self.names_to_metamodels.itervalues()
+
     def _create_entity(self, name):
         """
         Create instance of named entity given bank type
@@ -12,7 +12,10 @@
  banks of metamodel instances
 """
 
-import pickle
+import cPickle as pickle
+import io
+import tarfile
+import time
 from functools import partial
 from subprocess import CalledProcessError
 from enum import Enum, unique
@@ -20,6 +23,11 @@ from graphviz import Digraph
 from graphviz.backend import ExecutableNotFound, RequiredArgumentError
 
 import yaml
+try:
+    # libyaml based emitter, if PyYAML was built with it
+    from yaml import CDumper as YAMLDumper
+except ImportError:
+    from yaml import Dumper as YAMLDumper
 
 from chris_ros_modeling.utilities.logger import Logger, LoggerLevel
 from chris_ros_modeling.utilities.utility import create_directory_path, get_input_file_type
@@ -29,6 +37,17 @@ from chris_ros_modeling.base_metamodel import _BankMetamodel, _EntityMetamodel
 import chris_ros_modeling.metamodels
 
 
+def _represent_metamodel(dumper, data):
+    """
+    Represent metamodel instances with their own YAML tag; YAMLObject
+    only registers its representers with the default Dumper
+    """
+    return type(data).to_yaml(dumper, data)
+
+YAMLDumper.add_multi_representer(_BankMetamodel, _represent_metamodel)
+YAMLDumper.add_multi_representer(_EntityMetamodel, _represent_metamodel)
+
+
 @unique
 class BankType(Enum):
     """
@@ -221,16 +240,18 @@ class ROSModel(object):
         """
         return self._bank_dictionary[BankType.NODE_SPECIFICATION]
 
-    def save_model_info_files(self, directory_path, base_file_name):
+    def save_model_info_files(self, directory_path, base_file_name, create_directory=True):
         """
         Save the ROS model to human-readable files
         :param directory_path : directory to store files
         :param base_file_name: file name string
+        :param create_directory: create directory path if required (False if already created)
         :return:
         """
         try:
             Logger.get_logger().log(LoggerLevel.INFO, 'Saving human-readable files for ROS Computation Graph.')
-            create_directory_path(directory_path)
+            if create_directory:
+                create_directory_path(directory_path)
             for bank_type, bank in self._bank_dictionary.items():
                 rows = []
                 rows.append(str(bank))
@@ -243,57 +264,130 @@ class ROSModel(object):
             Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to save human-readable files for ROS Computation Graph.')
             print "     ", ex
 
-    def save_model_yaml_files(self, directory_path, base_file_name):
+    def save_model_yaml_files(self, directory_path, base_file_name, create_directory=True):
         """
         Save the ROS bank metamodel instances to yaml files
         :param directory_path : directory to store files
         :param base_file_name:
+        :param create_directory: create directory path if required (False if already created)
         :return: None
         """
         try:
             Logger.get_logger().log(LoggerLevel.INFO, 'Saving YAML files for ROS Computation Graph.')
             #  ROSModel.get_yaml_processor()
-            create_directory_path(directory_path)
+            if create_directory:
+                create_directory_path(directory_path)
             for bank_type, bank in self._bank_dictionary.items():
                 bank_output_name = ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type]
                 file_name = '{}/{}_{}.yaml'.format(directory_path, base_file_name, bank_output_name)
                 yaml_file = open(file_name, 'w')
-                yaml.dump(bank, yaml_file, sort_keys=True)
+                yaml.dump(bank, yaml_file, Dumper=YAMLDumper, sort_keys=True)
                 yaml_file.close()
         except IOError as ex:
             Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to save YAML files for ROS Computation Graph.')
             print "     ", ex
 
-    def save_model_pickle_files(self, directory_path, base_file_name):
+    def save_model_pickle_files(self, directory_path, base_file_name, create_directory=True):
         """
         Save the ROS bank metamodel instances to Pickle files
         :param directory_path : directory to store files
         :param base_file_name:
+        :param create_directory: create directory path if required (False if already created)
         :return: None
         """
         try:
             Logger.get_logger().log(LoggerLevel.INFO, 'Saving Pickle files for ROS Model.')
-            create_directory_path(directory_path)
+            if create_directory:
+                create_directory_path(directory_path)
             for bank_type, bank in self._bank_dictionary.items():
                 bank_output_name = ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type]
                 file_name = '{}/{}_{}.pkl'.format(directory_path, base_file_name, bank_output_name)
-                with open(file_name, 'wb') as fout:
-                    pickle.dump(bank, fout)
+                # Large buffer avoids many small writes for the pickle stream
+                with io.open(file_name, 'wb', buffering=1 << 20) as fout:
+                    pickle.dump(bank, fout, pickle.HIGHEST_PROTOCOL)
         except IOError as ex:
             Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to save Pickle files for ROS Model.')
             print "     ", ex
 
-    def save_dot_graph_files(self, directory_path, file_name, show_graph=True):
+    def _add_bank_members_to_tar(self, tar_file, folder, base_file_name, extension, serialize):
+        """
+        Add one archive member per bank, serialized in memory
+        :param tar_file: open tarfile.TarFile to write into
+        :param folder: folder name within the archive
+        :param base_file_name: file name string
+        :param extension: file extension for the members
+        :param serialize: function returning the serialized string for a bank
+        :return: None
+        """
+        modification_time = time.time()
+        for bank_type, bank in self._bank_dictionary.items():
+            bank_output_name = ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type]
+            data = serialize(bank)
+            tar_info = tarfile.TarInfo('{}/{}_{}.{}'.format(folder, base_file_name, bank_output_name, extension))
+            tar_info.size = len(data)
+            tar_info.mtime = modification_time
+            tar_file.addfile(tar_info, io.BytesIO(data))
+
+    def save_model_info_to_tar(self, tar_file, folder, base_file_name):
+        """
+        Save the ROS model as human-readable files within an archive
+        :param tar_file: open tarfile.TarFile to write into
+        :param folder: folder name within the archive
+        :param base_file_name: file name string
+        :return: None
+        """
+        try:
+            Logger.get_logger().log(LoggerLevel.INFO, 'Archiving human-readable files for ROS Computation Graph.')
+            self._add_bank_members_to_tar(tar_file, folder, base_file_name, 'txt', str)
+        except (IOError, tarfile.TarError) as ex:
+            Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to archive human-readable files for ROS Computation Graph.')
+            print "     ", ex
+
+    def save_model_yaml_to_tar(self, tar_file, folder, base_file_name):
+        """
+        Save the ROS bank metamodel instances as yaml files within an archive
+        :param tar_file: open tarfile.TarFile to write into
+        :param folder: folder name within the archive
+        :param base_file_name: file name string
+        :return: None
+        """
+        try:
+            Logger.get_logger().log(LoggerLevel.INFO, 'Archiving YAML files for ROS Computation Graph.')
+            self._add_bank_members_to_tar(tar_file, folder, base_file_name, 'yaml',
+                                          partial(yaml.dump, Dumper=YAMLDumper, sort_keys=True))
+        except (IOError, tarfile.TarError) as ex:
+            Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to archive YAML files for ROS Computation Graph.')
+            print "     ", ex
+
+    def save_model_pickle_to_tar(self, tar_file, folder, base_file_name):
+        """
+        Save the ROS bank metamodel instances as Pickle files within an archive
+        :param tar_file: open tarfile.TarFile to write into
+        :param folder: folder name within the archive
+        :param base_file_name: file name string
+        :return: None
+        """
+        try:
+            Logger.get_logger().log(LoggerLevel.INFO, 'Archiving Pickle files for ROS Model.')
+            self._add_bank_members_to_tar(tar_file, folder, base_file_name, 'pkl',
+                                          lambda bank: pickle.dumps(bank, pickle.HIGHEST_PROTOCOL))
+        except (IOError, tarfile.TarError) as ex:
+            Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to archive Pickle files for ROS Model.')
+            print "     ", ex
+
+    def save_dot_graph_files(self, directory_path, file_name, show_graph=True, create_directory=True):
         """
         Save the ROS model computation graph to DOT file format
         :param directory_path : directory to store files
         :param file_name: file name of the graph data
         :param show_graph: show output when complete
+        :param create_directory: create directory path if required (False if already created)
         :return: None
         """
         try:
             Logger.get_logger().log(LoggerLevel.INFO, 'Saving DOT files for ROS Computation Graph.')
-            create_directory_path(directory_path)
+            if create_directory:
+                create_directory_path(directory_path)
             dot_graph = Digraph(comment='ROS Computation Graph',
                                 engine='dot',
                                 graph_attr={'concentrate': 'true'},
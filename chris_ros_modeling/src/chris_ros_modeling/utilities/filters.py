@@ -31,6 +31,16 @@ class Filter(object):
             self._debug_exclusions = self.__class__.DEBUG_EXCLUSIONS
         if filter_out_tf:
             self._tf_exclusions = self.__class__.TF_EXCLUSIONS
+        self._exclusion_set = None
+        self._update_exclusion_set()
+
+    def _update_exclusion_set(self):
+        """
+        Rebuild the single set of all exclusions; call whenever the
+        exclusions change
+        """
+        self._exclusion_set = frozenset(self._base_exclusions).union(self._debug_exclusions,
+                                                                     self._tf_exclusions)
 
     def should_filter_out(self, item):
         """
@@ -38,9 +48,28 @@ class Filter(object):
         :param item:
         :return: True if we should filter, False otherwise
         """
-        return (item in self._base_exclusions) or \
-               (item in self._debug_exclusions) or \
-               (item in self._tf_exclusions)
+        return item in self._exclusion_set
+
+    def exclusion_set(self):
+        """
+        Get all exclusions as a single set
+        :return: frozenset of all exclusions
+        """
+        return self._exclusion_set
+
+    @classmethod
+    def add_base_exclusion(cls, item):
+        """
+        Add an item to the base exclusions of this filter class, updating
+        the filter instance if it already exists
+        :param item: item to exclude
+        """
+        # Assign a new set so that the exclusions are not shared with other filter classes
+        cls.BASE_EXCLUSIONS = set(cls.BASE_EXCLUSIONS)
+        cls.BASE_EXCLUSIONS.add(item)
+        if cls.INSTANCE is not None:
+            cls.INSTANCE._base_exclusions = cls.BASE_EXCLUSIONS
+            cls.INSTANCE._update_exclusion_set()
 
     @classmethod
     def get_filter(cls):
@@ -45,13 +45,23 @@ class Logger(object):
         logging.basicConfig(format='[%(asctime)s][%(levelname)s]-> %(message)s',
                             datefmt='%d%b%Y %I:%M:%S %p %Z', level=level)
 
-    def log(self, level, message):
+    def log(self, level, message, *args):
         """
         log message at level
         :param level: logging level
-        :param message: text string to log
+        :param message: text string to log; with args, a %-format
+            string that is only formatted if the level is enabled
+        :param args: optional arguments for the format string
         """
-        self._logger.log(level, message)
+        self._logger.log(level, message, *args)
+
+    def is_enabled_for(self, level):
+        """
+        Check whether messages at level would be logged
+        :param level: logging level
+        :return: True if enabled, False otherwise
+        """
+        return self._logger.isEnabledFor(level)
 
     @classmethod
     def get_logger(cls):
@@ -24,6 +24,17 @@ def create_directory_path(directory_path):
         Logger.get_logger().log(LoggerLevel.DEBUG, 'Creating directory path {}.'.format(directory_path))
         os.makedirs(directory_path)
 
+def intern_string(value):
+    """
+    Intern a name so that repeated occurrences share storage and
+    compare by identity
+    :param value: name to intern
+    :return: interned name; non-str values (e.g. unicode) are returned unchanged
+    """
+    if isinstance(value, str):
+        return intern(value)
+    return value
+
 def find_common_start(str_a, str_b):
     """
     Find common starting string from two strings
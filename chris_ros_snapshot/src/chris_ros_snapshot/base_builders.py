@@ -27,6 +27,7 @@ class _EntityBuilder(object):
     """
 
     __metaclass__ = ABCMeta
+    __slots__ = ('_name', '_name_suffix', '_name_base')
 
     def __init__(self, name):
         """
@@ -167,6 +168,20 @@ class _BankBuilder(object):
         for entity_builder in entity_builders:
             self.add_entity_builder(entity_builder)
 
+    def bulk_init(self, names):
+        """
+        Instantiates new *EntityBuilders for each of the names that
+        are not already present in the internal store of builders
+
+        :param names: the names to ensure builders exist for
+        :type names: iterable(str)
+        """
+        names_to_entity_builders = self._names_to_entity_builders
+        new_entity_builders = [self._create_entity_builder(name) for name in set(names)
+                               if name not in names_to_entity_builders]
+        names_to_entity_builders.update((entity_builder.name, entity_builder)
+                                        for entity_builder in new_entity_builders)
+
     def remove_entity_builder(self, name):
         """
         Removes an *EntityBuilder from the internal store of builders,
@@ -200,29 +215,25 @@ class _BankBuilder(object):
         :return: a dictionary of names to filtered *EntityBuilders
         :rtype: dict{str: *EntityBuilder}
         """
-        filtered_names_to_entity_builders = {}
-        for name, entity_builder in self.names_to_entity_builders.items():
-            if not self._should_filter_out(name, entity_builder):
-                filtered_names_to_entity_builders[name] = entity_builder
-        return filtered_names_to_entity_builders
+        should_filter_out = self._get_should_filter_out()
+        return {name: entity_builder for name, entity_builder in self.names_to_entity_builders.iteritems()
+                if not should_filter_out(name, entity_builder)}
 
-    def _should_filter_out(self, name, entity_builder):
+    def _get_should_filter_out(self):
         """
-        Indicates whether a given *EntityBuilder (which has a name to
-        identify it) should be filtered out or not; unless implemented
-        by a subclass, this method always returns False
+        Returns the function that indicates whether a given
+        *EntityBuilder (which has a name to identify it) should be
+        filtered out or not; it is looked up once per gathering, and
+        unless implemented by a subclass, the function always returns
+        False
 
-        :param name: the name to identify the *EntityBuilder
-        :type name: str
-        :param entity_builder: the *EntityBuilder to check
-        :type entity_builder: *EntityBuilder
-        :return: True if the *EntityBuilder should be filtered out;
+        :return: a function of the name and the *EntityBuilder that
+            returns True if the *EntityBuilder should be filtered out;
             False if not
-        :rtype: bool
+        :rtype: function(str, *EntityBuilder)
         """
-        #pylint: disable=unused-argument
         #pylint: disable=no-self-use
-        return False
+        return lambda name, entity_builder: False
 
     def prepare(self, **kwargs):
         """
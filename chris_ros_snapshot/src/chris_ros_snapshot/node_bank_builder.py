@@ -36,20 +36,18 @@ class NodeBankBuilder(_BankBuilder):
         """
         return NodeBuilder(name)
 
-    def _should_filter_out(self, name, entity_builder):
+    def _get_should_filter_out(self):
         """
-        Indicates whether the given NodeBuilder (which has a name to
-        identify it) should be filtered out or not
+        Returns the function that indicates whether a given NodeBuilder
+        (which has a name to identify it) should be filtered out or not;
+        the NodeFilter is looked up once, rather than per NodeBuilder
 
-        :param name: the name to identify the NodeBuilder
-        :type name: str
-        :param entity_builder: the NodeBuilder to check
-        :type entity_builder: NodeBuilder
-        :return: True if the NodeBuilder should be filtered out;
-            False if not
-        :rtype: bool
+        :return: a function of the name and the NodeBuilder that returns
+            True if the NodeBuilder should be filtered out; False if not
+        :rtype: function(str, NodeBuilder)
         """
-        return filters.NodeFilter.get_filter().should_filter_out(name)
+        should_filter_out = filters.NodeFilter.get_filter().should_filter_out
+        return lambda name, entity_builder: should_filter_out(name)
 
     def _post_prepare(self):
         """
@@ -23,8 +23,10 @@ from chris_ros_modeling.metamodels import Node, Nodelet, NodeletManager
 from chris_ros_snapshot.base_builders import _EntityBuilder
 from chris_ros_snapshot.topic_builder import TopicBuilder
 from chris_ros_snapshot.action_builder import ActionBuilder
-from chris_ros_snapshot.ros_utilities import ROSUtilities
+from chris_ros_snapshot.ros_utilities import get_ros_utilities
 
+_BOND_STATUS = 'bond/Status'
+_NODELET_MANAGER_SERVICES = frozenset(('nodelet/NodeletList', 'nodelet/NodeletLoad', 'nodelet/NodeletUnload'))
 
 class NodeBuilder(_EntityBuilder):
     """
@@ -34,6 +36,12 @@ class NodeBuilder(_EntityBuilder):
     further populating itself from that information for the purpose
     of extracting a metamodel instance
     """
+    __slots__ = ('_all_topic_names', '_topic_names', '_topic_names_to_types',
+                 '_service_names_to_types', '_service_names_to_remap',
+                 '_parameter_names', '_node', '_uri', '_uri_is_unknown',
+                 '_process_dict', '_machine', '_is_nodelet', '_is_nodelet_manager',
+                 '_nodelet_manager_name', '_nodelet_names',
+                 '_nodelet_or_manager_topic_names', '_action_names')
 
     def __init__(self, name):
         """
@@ -45,22 +53,25 @@ class NodeBuilder(_EntityBuilder):
         """
 
         super(NodeBuilder, self).__init__(name)
-        self._all_topic_names = dict()
-        self._topic_names = {'published': dict(), 'subscribed': dict()}
-        self._topic_names_to_types = dict()
-        self._service_names_to_types = dict()
+        # Containers are allocated on first write; most nodes leave
+        # several of these empty, so None is used until needed
+        self._all_topic_names = None
+        self._topic_names = None
+        self._topic_names_to_types = None
+        self._service_names_to_types = None
         self._service_names_to_remap = None
-        self._parameter_names = {'set': dict(), 'read': dict()}
+        self._parameter_names = None
         self._node = None
         self._uri = None
+        self._uri_is_unknown = False
         self._process_dict = None
         self._machine = None
         self._is_nodelet = False
         self._is_nodelet_manager = False
         self._nodelet_manager_name = None
-        self._nodelet_names = set()
-        self._nodelet_or_manager_topic_names = {'published': dict(), 'subscribed': dict()}
-        self._action_names = {'server': dict(), 'client': dict()}
+        self._nodelet_names = None
+        self._nodelet_or_manager_topic_names = None
+        self._action_names = None
 
     def prepare(self, **kwargs):
         """
@@ -126,7 +137,7 @@ class NodeBuilder(_EntityBuilder):
         if self._machine is None:
             self._machine = "UNKNOWN MACHINE"  # initialize
 
-            if "UNKNOWN" in self._uri:
+            if self._uri_is_unknown:
                 # Abandon if uri is unknown
                 return self._machine
 
@@ -154,10 +165,13 @@ class NodeBuilder(_EntityBuilder):
         :rtype: str
         """
         try:
-            return ROSUtilities.get_ros_utilities().master.lookupNode(self.name)
+            uri = get_ros_utilities().master.lookupNode(self.name)
+            self._uri_is_unknown = False
+            return uri
         except rosgraph.masterapi.MasterError as ex:
             error_message = 'URI for node {} cannot be retrieved from ROS Master'.format(self.name)
             Logger.get_logger().log(LoggerLevel.ERROR, '{}: {}.'.format(error_message, ex))
+            self._uri_is_unknown = True
             return "UNKNOWN URI FOR {}".format(self.name)
 
     @property
@@ -242,7 +256,7 @@ class NodeBuilder(_EntityBuilder):
         try:
             if self._process_dict is None:
                 try:
-                    if "UNKNOWN" in self._uri:
+                    if self._uri_is_unknown:
                         self._process_dict = {}
                         return "INVALID URI - CANNOT RETRIEVE {} FOR {}".format(key.upper(), self.name)
 
@@ -284,6 +298,8 @@ class NodeBuilder(_EntityBuilder):
         :return: set Parameter names
         :rtype: set{str}
         """
+        if self._parameter_names is None:
+            return {}
         return self._parameter_names['set']
 
     @property
@@ -295,6 +311,8 @@ class NodeBuilder(_EntityBuilder):
         :return: read Parameter names
         :rtype: set{str}
         """
+        if self._parameter_names is None:
+            return {}
         return self._parameter_names['read']
 
     def add_parameter_name(self, parameter_name, status, remap):
@@ -309,8 +327,25 @@ class NodeBuilder(_EntityBuilder):
         :param remap: name used in node specification
         :type remap: str:
         """
+        if self._parameter_names is None:
+            self._parameter_names = {'set': {}, 'read': {}}
         self._parameter_names[status][parameter_name] = remap
 
+    def add_parameter_names(self, parameter_names, status):
+        """
+        Associates several 'read' or 'set' Parameter names with the ROS
+        Node, without a name used in node specification
+
+        :param parameter_names: the names of the Parameters
+        :type parameter_names: iterable(str)
+        :param status: the relationship or status ('read' or 'set') of
+            the Parameters to the ROS Node
+        :type status: str
+        """
+        if self._parameter_names is None:
+            self._parameter_names = {'set': {}, 'read': {}}
+        self._parameter_names[status].update(dict.fromkeys(parameter_names))
+
     @property
     def published_topic_names(self):
         """
@@ -319,6 +354,8 @@ class NodeBuilder(_EntityBuilder):
         :return: published Topic names
         :rtype: dict{name:remap}
         """
+        if self._topic_names is None:
+            return {}
         return self._topic_names['published']
 
     @property
@@ -329,6 +366,8 @@ class NodeBuilder(_EntityBuilder):
         :return: subscribed Topic names
         :rtype: set{str}
         """
+        if self._topic_names is None:
+            return {}
         return self._topic_names['subscribed']
 
     @property
@@ -342,9 +381,11 @@ class NodeBuilder(_EntityBuilder):
         :return: all Topic names
         :rtype: set{str}
         """
+        if self._all_topic_names is None:
+            return {}
         return self._all_topic_names
 
-    def add_topic_name(self, topic_name, status, topic_type, remap):
+    def add_topic_name(self, topic_name, status, topic_type, remap, should_filter_out=None):
         """
         Associates a 'published' or 'subscribed' Topic with a ROS Node
 
@@ -357,9 +398,17 @@ class NodeBuilder(_EntityBuilder):
         :type topic_type: str
         :param remap: name used by node specificiation
         "type remap: str"
-        """
-        topic_filter = filters.TopicFilter.get_filter()
-        if not topic_filter.should_filter_out(topic_name):
+        :param should_filter_out: the TopicFilter check, so that callers
+            adding many Topics look it up once; defaults to the TopicFilter
+        :type should_filter_out: function(str)
+        """
+        if should_filter_out is None:
+            should_filter_out = filters.TopicFilter.get_filter().should_filter_out
+        if not should_filter_out(topic_name):
+            if self._topic_names is None:
+                self._all_topic_names = {}
+                self._topic_names = {'published': {}, 'subscribed': {}}
+                self._topic_names_to_types = {}
             self._all_topic_names[topic_name] = remap
             self._topic_names[status][topic_name] = remap
             self._topic_names_to_types[topic_name] = topic_type
@@ -375,7 +424,8 @@ class NodeBuilder(_EntityBuilder):
             'published') of the Topic to the ROS Node
         :type status: str
         """
-        self._topic_names[status].pop(topic_name, None)
+        if self._topic_names is not None:
+            self._topic_names[status].pop(topic_name, None)
 
     @property
     def topic_names_to_types(self):
@@ -387,6 +437,8 @@ class NodeBuilder(_EntityBuilder):
         :return: all Topic names to their mapped ROS Topic Type
         :rtype: dict{str: str}
         """
+        if self._topic_names_to_types is None:
+            return {}
         return self._topic_names_to_types
 
     @property
@@ -398,6 +450,8 @@ class NodeBuilder(_EntityBuilder):
         :return: all Service names to their mapped ROS Service Type
         :rtype: dict{str: str}
         """
+        if self._service_names_to_types is None:
+            return {}
         return self._service_names_to_types
 
     @property
@@ -424,7 +478,7 @@ class NodeBuilder(_EntityBuilder):
 
         return self._service_names_to_remap
 
-    def add_service_name_and_type(self, service_name, service_type):
+    def add_service_name_and_type(self, service_name, service_type, should_filter_out=None):
         """
         Associates the name of a Service with the ROS Node
 
@@ -432,9 +486,16 @@ class NodeBuilder(_EntityBuilder):
         :type service_name: str
         :param service_type: the ROS Service type
         :type service_type: str
-        """
-        service_filter = filters.ServiceTypeFilter.get_filter()
-        if not service_filter.should_filter_out(service_type):
+        :param should_filter_out: the ServiceTypeFilter check, so that
+            callers adding many Services look it up once; defaults to
+            the ServiceTypeFilter
+        :type should_filter_out: function(str)
+        """
+        if should_filter_out is None:
+            should_filter_out = filters.ServiceTypeFilter.get_filter().should_filter_out
+        if not should_filter_out(service_type):
+            if self._service_names_to_types is None:
+                self._service_names_to_types = {}
             self._service_names_to_types[service_name] = service_type
 
     @property
@@ -456,11 +517,8 @@ class NodeBuilder(_EntityBuilder):
         :rtype: bool
         """
         for topic_name in self.all_topic_names:
-            if self.topic_names_to_types[topic_name] == 'bond/Status':
-                service_types = set([self.service_names_to_types[service_name] for service_name in self.service_names])
-                return ('nodelet/NodeletList' in service_types and
-                        'nodelet/NodeletLoad' in service_types and
-                        'nodelet/NodeletUnload' in service_types)
+            if self.topic_names_to_types[topic_name] == _BOND_STATUS:
+                return _NODELET_MANAGER_SERVICES.issubset(self.service_names_to_types.itervalues())
         return False
 
     @property
@@ -483,7 +541,7 @@ class NodeBuilder(_EntityBuilder):
         :rtype: bool
         """
         for topic_name in self.all_topic_names:
-            if self.topic_names_to_types[topic_name] == 'bond/Status':
+            if self.topic_names_to_types[topic_name] == _BOND_STATUS:
                 return not self.is_nodelet_manager
         return False
 
@@ -516,6 +574,8 @@ class NodeBuilder(_EntityBuilder):
         :return: names of the associated Nodelets
         :rtype: set{str}
         """
+        if self._nodelet_names is None:
+            return set()
         return self._nodelet_names
 
     def add_nodelet_name(self, nodelet_name):
@@ -526,6 +586,8 @@ class NodeBuilder(_EntityBuilder):
         :param nodelet_name: the name of the Nodelet to associate
         :type nodelet_name: str
         """
+        if self._nodelet_names is None:
+            self._nodelet_names = set()
         self._nodelet_names.add(nodelet_name)
 
     @property
@@ -538,6 +600,8 @@ class NodeBuilder(_EntityBuilder):
             Topics
         :rtype: set{str}
         """
+        if self._nodelet_or_manager_topic_names is None:
+            return {}
         return self._nodelet_or_manager_topic_names['published']
 
     @property
@@ -550,6 +614,8 @@ class NodeBuilder(_EntityBuilder):
             Topics
         :rtype: set{str}
         """
+        if self._nodelet_or_manager_topic_names is None:
+            return {}
         return self._nodelet_or_manager_topic_names['subscribed']
 
     @staticmethod
@@ -569,14 +635,13 @@ class NodeBuilder(_EntityBuilder):
             extracted Nodelet / Nodelet Manager Topic names
         :rtype: dict{str: set{str}}
         """
-        bond_topic_type = 'bond/Status'
         nodelet_or_manager_topic_names = {'published': dict(), 'subscribed': dict()}
         for topic_name in set(topic_names['published'].keys()):
-            if topic_names_to_types[topic_name] == bond_topic_type:
+            if topic_names_to_types[topic_name] == _BOND_STATUS:
                 nodelet_or_manager_topic_names['published'][topic_name] = topic_names['published'][topic_name]
                 topic_names['published'].pop(topic_name, None)
         for topic_name in set(topic_names['subscribed'].keys()):
-            if topic_names_to_types[topic_name] == bond_topic_type:
+            if topic_names_to_types[topic_name] == _BOND_STATUS:
                 nodelet_or_manager_topic_names['subscribed'][topic_name] = topic_names['subscribed'][topic_name]
                 topic_names['subscribed'].pop(topic_name, None)
         return nodelet_or_manager_topic_names
@@ -596,12 +661,14 @@ class NodeBuilder(_EntityBuilder):
         :type action_bank_builder: ActionBankBuilder
         :return: the mapping of Action Server / Client roles ('server'
             or 'client') to extracted Action names
-        :rtype: dict{str: dict{str:str}}
-        """
-        extracted_action_names = {'server': dict(), 'client': dict()}
-        valid_topic_names = [topic_name for topic_name in topic_bank_builder.names_to_entity_builders.keys()]
-        for status, topic_name_dict in {'published': self.published_topic_names,
-                                        'subscribed': self.subscribed_topic_names}.items():
+        :rtype: dict{str: dict{str:str}} or None if no Actions are found
+        """
+        extracted_action_names = None
+        if self._topic_names is None:
+            return extracted_action_names
+        valid_topic_names = topic_bank_builder.names_to_entity_builders
+        for status, topic_name_dict in (('published', self._topic_names['published']),
+                                        ('subscribed', self._topic_names['subscribed'])):
             #Logger.get_logger().log(LoggerLevel.INFO,
             #                        'Searching for {} action topics for node {}.'.format(status, self.name))
             for topic_name in set(topic_name_dict.keys()):
@@ -614,9 +681,13 @@ class NodeBuilder(_EntityBuilder):
                         log_message = 'Found action {}. Removing topic {} from node {}.'.format(
                             name_base, topic_name, self.name)
                         if self.name in action_builder.client_node_names:
+                            if extracted_action_names is None:
+                                extracted_action_names = {'server': {}, 'client': {}}
                             extracted_action_names['client'][name_base] = None
                             self.remove_topic_name(topic_name, status)
                         elif self.name in action_builder.server_node_names:
+                            if extracted_action_names is None:
+                                extracted_action_names = {'server': {}, 'client': {}}
                             extracted_action_names['server'][name_base] = None
                             self.remove_topic_name(topic_name, status)
                         else:
@@ -634,6 +705,8 @@ class NodeBuilder(_EntityBuilder):
         :return: Action names where this ROS Node is a Server
         :rtype: set{str}
         """
+        if self._action_names is None:
+            return {}
         return self._action_names['server']
 
     @property
@@ -645,6 +718,8 @@ class NodeBuilder(_EntityBuilder):
         :return: Action names where this ROS Node is a Client
         :rtype: set{str}
         """
+        if self._action_names is None:
+            return {}
         return self._action_names['client']
 
     def _populate_metamodel_with_common_info(self, node_metamodel):
@@ -17,8 +17,33 @@ information for the purpose of extracting metamodel instances
 import rosgraph
 
 from chris_ros_modeling.metamodels import Parameter
+from chris_ros_modeling.utilities.utility import intern_string
 from chris_ros_snapshot.base_builders import _EntityBuilder
-from chris_ros_snapshot.ros_utilities import ROSUtilities
+from chris_ros_snapshot.ros_utilities import get_ros_utilities
+
+# Shared result for Parameters without setting / reading ROS Nodes
+_NO_NODE_NAMES = frozenset()
+
+
+def iter_params(root):
+    """
+    Iterates over a nested Parameter tree, as returned by the ROS
+    Master for a namespace, without recursion; namespaces are yielded
+    with their subtree as value, followed by their contents
+
+    :param root: the Parameter tree for the root namespace
+    :type root: dict
+    :return: generator of full Parameter names and values
+    :rtype: generator(tuple(str, value))
+    """
+    stack = [('', root)]
+    while stack:
+        prefix, node = stack.pop()
+        if prefix:
+            yield prefix, node
+        if isinstance(node, dict):
+            for key, value in node.items():
+                stack.append((prefix + '/' + key, value))
 
 
 class ParameterBuilder(_EntityBuilder):
@@ -29,6 +54,8 @@ class ParameterBuilder(_EntityBuilder):
     further populating itself from that information for the purpose
     of extracting a metamodel instance
     """
+    __slots__ = ('_setting_node_names', '_reading_node_names',
+                 '_cached_value', '_value_fetched', '_python_type')
 
     def __init__(self, name):
         """
@@ -38,20 +65,67 @@ class ParameterBuilder(_EntityBuilder):
             ParameterBuilder represents
         :type name: str
         """
-        super(ParameterBuilder, self).__init__(name)
-        self._setting_node_names = set()
-        self._reading_node_names = set()
+        super(ParameterBuilder, self).__init__(intern_string(name))
+        self._setting_node_names = None
+        self._reading_node_names = None
+        self._cached_value = None
+        self._value_fetched = False
+        self._python_type = None
+
+    def prepare(self, **kwargs):
+        """
+        Allows this ParameterBuilder to prepare its internal state
+        for eventual metamodel extraction; the value is taken from the
+        batch of Parameter values, where a missing name means the
+        Parameter no longer exists on the ROS Master
+
+        :param parameter_values: mapping of Parameter names to values
+            retrieved from the ROS Master in a single query, or None to
+            query the ROS Master individually (from kwargs)
+        :type parameter_values: dict{str: value}
+        """
+        parameter_values = kwargs.get('parameter_values')
+        if parameter_values is not None:
+            self.set_value(parameter_values.get(self.name))
 
     @property
     def value(self):
         """
-        Returns the value of the Parameter
+        Returns the value of the Parameter; the value is retrieved
+        from the ROS Master on first access and cached thereafter
 
         :return: the value of the Parameter
         :rtype: str
         """
+        if not self._value_fetched:
+            self._cached_value = self._fetch_value()
+            self._value_fetched = True
+        return self._cached_value
+
+    def set_value(self, value):
+        """
+        Sets the value of the Parameter directly, bypassing the query
+        to the ROS Master
+
+        :param value: the value of the Parameter
+        :type value: str
+        """
+        if isinstance(value, str):
+            value = value.strip()
+        self._cached_value = value
+        self._value_fetched = True
+        self._python_type = None
+
+    def _fetch_value(self):
+        """
+        Helper method to retrieve the value of the Parameter from the
+        ROS Master
+
+        :return: the value of the Parameter, or None if unavailable
+        :rtype: str
+        """
         try:
-            value = ROSUtilities.get_ros_utilities().master.getParam(self.name)
+            value = get_ros_utilities().master.getParam(self.name)
             if isinstance(value, str):
                 return value.strip()
             return value
@@ -68,7 +142,9 @@ class ParameterBuilder(_EntityBuilder):
         :return: the Python type of the Parameter's value
         :rtype: str
         """
-        return str(type(self.value)).replace('<', '').replace('>', '').replace('type', '').replace('\'', '').strip()
+        if self._python_type is None:
+            self._python_type = type(self.value).__name__
+        return self._python_type
 
     @property
     def construct_type(self):
@@ -90,6 +166,8 @@ class ParameterBuilder(_EntityBuilder):
             a value for this Parameter
         :rtype: set{str}
         """
+        if self._setting_node_names is None:
+            return _NO_NODE_NAMES
         return self._setting_node_names
 
     @property
@@ -102,6 +180,8 @@ class ParameterBuilder(_EntityBuilder):
             a value for this Parameter
         :rtype: set{str}
         """
+        if self._reading_node_names is None:
+            return _NO_NODE_NAMES
         return self._reading_node_names
 
     def add_setting_node_name(self, node_name):
@@ -113,7 +193,22 @@ class ParameterBuilder(_EntityBuilder):
             for this Parameter
         :type node_name: str
         """
-        self._setting_node_names.add(node_name)
+        if self._setting_node_names is None:
+            self._setting_node_names = set()
+        self._setting_node_names.add(intern_string(node_name))
+
+    def add_setting_node_names(self, node_names):
+        """
+        Associates the names of several ROS Nodes that have set a value
+        for this Parameter with this Parameter
+
+        :param node_names: the names of the ROS Nodes that have set a
+            value for this Parameter
+        :type node_names: iterable(str)
+        """
+        if self._setting_node_names is None:
+            self._setting_node_names = set()
+        self._setting_node_names.update(intern_string(node_name) for node_name in node_names)
 
     def add_reading_node_name(self, node_name):
         """
@@ -124,7 +219,22 @@ class ParameterBuilder(_EntityBuilder):
             for this Parameter
         :type node_name: str
         """
-        self._reading_node_names.add(node_name)
+        if self._reading_node_names is None:
+            self._reading_node_names = set()
+        self._reading_node_names.add(intern_string(node_name))
+
+    def add_reading_node_names(self, node_names):
+        """
+        Associates the names of several ROS Nodes that have read a value
+        for this Parameter with this Parameter
+
+        :param node_names: the names of the ROS Nodes that have read a
+            value for this Parameter
+        :type node_names: iterable(str)
+        """
+        if self._reading_node_names is None:
+            self._reading_node_names = set()
+        self._reading_node_names.update(intern_string(node_name) for node_name in node_names)
 
     def extract_metamodel(self):
         """
@@ -134,10 +244,13 @@ class ParameterBuilder(_EntityBuilder):
         :return: the created / extracted metamodel instance
         :rtype: Parameter
         """
+        value = self.value
+        setting_node_names = self._setting_node_names
+        reading_node_names = self._reading_node_names
         parameter_metamodel = Parameter(source='ros_snapshot',
                                         name=self.name,
                                         python_type=self.python_type,
-                                        value=self.value,
-                                        setting_node_names=self.setting_node_names,
-                                        reading_node_names=self.reading_node_names)
+                                        value=value,
+                                        setting_node_names=set() if setting_node_names is None else setting_node_names,
+                                        reading_node_names=set() if reading_node_names is None else reading_node_names)
         return parameter_metamodel
@@ -14,41 +14,100 @@ Simple class to hold dictionary of name to remapped key
     Supports a one-to-many re-mapping
 
 """
+import collections
 
+from chris_ros_modeling.utilities.logger import Logger, LoggerLevel
+from chris_ros_modeling.utilities.utility import intern_string
 
-class RemapperBank(object):
+
+class RemapperBank(collections.Mapping):
     """
     Remapper from data to key for various banks
     """
+    __slots__ = ('_data_to_key_maps',)
+
     def __init__(self):
         """
         Instantiates an instance of the RemapperBank
         """
+        # Keys are stored internally as sets of remapped names
         self._data_to_key_maps = {}
 
+    @staticmethod
+    def _materialize(keys):
+        """
+        Helper method to convert an internal set of remapped names to
+        the public form
+
+        :param keys: the set of remapped names
+        :type keys: set{str}
+        :return: the single remapped name, or a sorted list if there
+            are several
+        :rtype: str or list[str]
+        """
+        if len(keys) == 1:
+            return next(iter(keys))
+        return sorted(keys)
+
     def __getitem__(self, data_name):
         """
         Returns the appropriate Remapped name
         :param data_name: the key to identify the desired mapping
         :type name: str
-        :return: the corresponding string
+        :return: the corresponding string, or a sorted list of strings
+            for a one-to-many mapping
+        """
+        return self._materialize(self._data_to_key_maps[data_name])
+
+    def __contains__(self, data_name):
+        """
+        Tests whether a mapping exists for data_name
+        :param data_name: the key to identify the desired mapping
+        :type data_name: str
+        :return: True if a mapping exists
+        :rtype: bool
+        """
+        return data_name in self._data_to_key_maps
+
+    def __len__(self):
         """
-        return self._data_to_key_maps[data_name]
+        :return: the number of mappings in the remapper bank
+        :rtype: int
+        """
+        return len(self._data_to_key_maps)
 
+    def __iter__(self):
+        """
+        :return: an iterator over the keys for remapper bank
+        """
+        return iter(self._data_to_key_maps)
+
+    def get(self, data_name, default=None):
+        """
+        Returns the appropriate Remapped name, or default if there is
+        no mapping for data_name
+        :param data_name: the key to identify the desired mapping
+        :type name: str
+        :param default: the value returned if no mapping exists
+        :return: the corresponding string, or a sorted list of strings
+            for a one-to-many mapping
+        """
+        keys = self._data_to_key_maps.get(data_name)
+        if keys is None:
+            return default
+        return self._materialize(keys)
 
-    @property
     def keys(self):
         """
         :return: the keys for remapper bank
         """
         return self._data_to_key_maps.keys()
 
-    @property
     def items(self):
         """
         :return: the key, value pairs for remapper bank
         """
-        return self._data_to_key_maps.items()
+        return [(data_name, self._materialize(keys)) for data_name, keys in self._data_to_key_maps.items()]
 
     def add_remap(self, data_name, key):
         """
@@ -61,20 +120,26 @@ class RemapperBank(object):
         :param key: the old key to data
         :type data_name: str
         """
-        if data_name not in self._data_to_key_maps or \
-           self._data_to_key_maps[data_name] is None:
+        data_name = intern_string(data_name)
+        key = intern_string(key)
+        existing = self._data_to_key_maps.get(data_name)
+        if existing is None:
             # New remap
-            self._data_to_key_maps[data_name] = key
-        else:
-            # remap exists
-            if key == self._data_to_key_maps[data_name]:
-                return
-
-            if isinstance(self._data_to_key_maps[data_name], list):
-                if key not in self._data_to_key_maps[data_name]:
-                    print "    Adding ", key, " to existing ", data_name, self._data_to_key_maps[data_name]
-                    self._data_to_key_maps[data_name].append(key)
-            else:
-                print "    Adding ", key, " to existing ", data_name, " as list", self._data_to_key_maps[data_name]
-                self._data_to_key_maps[data_name] = [self._data_to_key_maps[data_name]]
-                self._data_to_key_maps[data_name].append(key)
+            self._data_to_key_maps[data_name] = {key}
+        elif key not in existing:
+            Logger.get_logger().log(LoggerLevel.DEBUG, '    Adding %s to existing %s %s',
+                                    key, data_name, existing)
+            existing.add(key)
+
+    def update(self, pairs):
+        """
+        Adds remappings from data_name to key in bulk
+
+        Supports a one-to-many mapping, as for add_remap
+
+        :param pairs: the (data_name, key) pairs to add
+        :type pairs: iterable(tuple(str, str))
+        """
+        add_remap = self.add_remap
+        for data_name, key in pairs:
+            add_remap(data_name, key)
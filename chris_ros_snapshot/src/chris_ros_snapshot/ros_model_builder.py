@@ -10,11 +10,49 @@
 """
 Module for the ROSModelBuilder
 """
+from functools import partial
+from multiprocessing.pool import ThreadPool
+
+import rosgraph
+
 from chris_ros_modeling.ros_model import ROSModel, BankType
+from chris_ros_modeling.utilities.logger import Logger, LoggerLevel
+from chris_ros_modeling.utilities.utility import intern_string
+from chris_ros_snapshot.parameter_builder import iter_params
+from chris_ros_snapshot.ros_utilities import get_ros_utilities
 
 #pylint: disable=wildcard-import
 from chris_ros_snapshot.bank_builders import *
 
+# Maximum number of BankBuilders prepared concurrently
+_PREPARE_WORKERS = 4
+
+# BankTypes whose preparation depends on the other BankBuilders
+_SPEC_TYPES = frozenset({BankType.NODE, BankType.NODELET, BankType.NODELET_MANAGER, BankType.MACHINE})
+
+# BankBuilders that extract more than one metamodel, keyed by BankType;
+# all others extract a single metamodel of their own BankType
+_METAMODEL_EXTRACTORS = {
+    BankType.NODE: lambda bank_builder_type, instance: (
+        (BankType.NODE, instance.extract_node_bank_metamodel()),
+        (BankType.NODELET, instance.extract_nodelet_bank_metamodel()),
+        (BankType.NODELET_MANAGER, instance.extract_nodelet_manager_bank_metamodel()))}
+
+
+def _extract_single_metamodel(bank_builder_type, instance):
+    """
+    Default metamodel extractor for BankBuilders that produce a single
+    *Bank of their own BankType
+
+    :param bank_builder_type: the BankType of the BankBuilder
+    :type bank_builder_type: BankType
+    :param instance: the BankBuilder
+    :type instance: BankBuilder
+    :return: the BankType and extracted *Bank pair
+    :rtype: tuple(tuple(BankType, *Bank))
+    """
+    return ((bank_builder_type, instance.extract_metamodel()),)
+
 
 class ROSModelBuilder(object):
     """
@@ -30,6 +68,8 @@ class ROSModelBuilder(object):
             topic type pairs
         :type topic_types: list[tuple(str, str)]
         """
+        topic_types = [(intern_string(topic_name), intern_string(topic_type))
+                       for topic_name, topic_type in topic_types]
         self._bank_builders = {BankType.NODE: NodeBankBuilder(),
                                BankType.TOPIC: TopicBankBuilder(topic_types),
                                BankType.ACTION: ActionBankBuilder(),
@@ -53,22 +93,65 @@ class ROSModelBuilder(object):
         """
         Prepares the individual BankBuilders to help build the ROSModel
         """
-        topic_bank_builder = self.get_bank_builder(BankType.TOPIC)
-        action_bank_builder = self.get_bank_builder(BankType.ACTION)
-        names_to_action_builders = topic_bank_builder.extract_action_builders_from_internal_topic_builders()
-        action_bank_builder.add_entity_builders(names_to_action_builders.values())
+        bank_builders = self._bank_builders
+        topic_bank_builder = bank_builders[BankType.TOPIC]
+        action_bank_builder = bank_builders[BankType.ACTION]
+        node_bank_builder = bank_builders[BankType.NODE]
+        action_bank_builder.add_entity_builders(
+            topic_bank_builder.extract_action_builders_from_internal_topic_builders())
+        parameter_values = ROSModelBuilder._gather_parameter_values()
+        independent_preparations = []
         for bank_builder_type in ROSModel.DEPLOYMENT_TYPES:
             # Process all types except specifications
-            if bank_builder_type != BankType.NODE and \
-               bank_builder_type != BankType.NODELET and \
-               bank_builder_type != BankType.NODELET_MANAGER and \
-               bank_builder_type != BankType.MACHINE:
-                self.get_bank_builder(bank_builder_type).prepare()
+            if bank_builder_type == BankType.PARAMETER:
+                independent_preparations.append(partial(bank_builders[bank_builder_type].prepare,
+                                                        parameter_values=parameter_values))
+            elif bank_builder_type not in _SPEC_TYPES:
+                independent_preparations.append(bank_builders[bank_builder_type].prepare)
+        ROSModelBuilder._run_concurrently(independent_preparations)
 
-        self.get_bank_builder(BankType.NODE).prepare(
+        # Node and Machine preparation depend on the banks prepared above
+        node_bank_builder.prepare(
             topic_bank_builder=topic_bank_builder, action_bank_builder=action_bank_builder)
-        self.get_bank_builder(BankType.MACHINE).prepare(
-            node_builders=self.get_bank_builder(BankType.NODE))
+        bank_builders[BankType.MACHINE].prepare(node_builders=node_bank_builder)
+
+    @staticmethod
+    def _run_concurrently(preparations):
+        """
+        Helper method to run independent BankBuilder preparations
+        concurrently; these are dominated by network I/O with the ROS
+        Master and ROS Nodes, so threads overlap the waiting time
+
+        :param preparations: the callables to run
+        :type preparations: list[callable]
+        """
+        pool = ThreadPool(min(_PREPARE_WORKERS, max(1, len(preparations))))
+        try:
+            pool.map(lambda prepare: prepare(), preparations)
+        finally:
+            pool.close()
+            pool.join()
+
+    @staticmethod
+    def _gather_parameter_values():
+        """
+        Helper method to retrieve the entire Parameter tree from the
+        ROS Master with a single query and flatten it into a mapping of
+        full Parameter names to values; namespaces are included with
+        their subtree as value, as a direct query would return them
+
+        :return: the mapping of Parameter names to values; None if the
+            Parameter tree cannot be retrieved
+        :rtype: dict{str: value}
+        """
+        try:
+            parameter_tree = get_ros_utilities().master.getParam('/')
+        except rosgraph.masterapi.MasterError as ex:
+            Logger.get_logger().log(LoggerLevel.WARNING,
+                                    'Parameter tree cannot be retrieved from ROS Master: {}.'.format(ex))
+            return None
+
+        return dict(iter_params(parameter_tree))
 
     def _extract_metamodels(self):
         """
@@ -78,15 +161,11 @@ class ROSModelBuilder(object):
         :return: a dictionary of bank names to *Bank instances
         :rtype: dict{str: *Bank}
         """
-        bank_builder_types_to_metamodels = dict()
+        bank_builder_types_to_metamodels = {}
+        get_extractor = _METAMODEL_EXTRACTORS.get
         for bank_builder_type, instance in self._bank_builders.items():
-            if bank_builder_type == BankType.NODE:
-                bank_builder_types_to_metamodels[BankType.NODE] = instance.extract_node_bank_metamodel()
-                bank_builder_types_to_metamodels[BankType.NODELET] = instance.extract_nodelet_bank_metamodel()
-                bank_builder_types_to_metamodels[BankType.NODELET_MANAGER] = instance.extract_nodelet_manager_bank_metamodel(
-                )
-            else:
-                bank_builder_types_to_metamodels[bank_builder_type] = instance.extract_metamodel()
+            extractor = get_extractor(bank_builder_type, _extract_single_metamodel)
+            bank_builder_types_to_metamodels.update(extractor(bank_builder_type, instance))
 
         return bank_builder_types_to_metamodels
 
@@ -13,9 +13,14 @@ ROS Snapshot Driver: a tool for probing active ROS deployments to
 discover the ROS Computation Graph and storing as a chris_ros_modeling model
 """
 import argparse
+from collections import defaultdict
+import cPickle as pickle
+import hashlib
 import os
+import shutil
 import socket
 import sys
+import tarfile
 import time
 import traceback
 
@@ -23,8 +28,143 @@ from chris_ros_snapshot.ros_model_builder import ROSModelBuilder
 from chris_ros_modeling.ros_model import ROSModel, BankType
 from chris_ros_modeling.utilities import filters
 from chris_ros_modeling.utilities.logger import Logger, LoggerLevel
+from chris_ros_modeling.utilities.utility import create_directory_path, get_input_file_type
 from chris_ros_snapshot.remapper_bank import RemapperBank
-from chris_ros_snapshot.ros_utilities import ROSUtilities
+from chris_ros_snapshot.ros_utilities import get_ros_utilities
+
+
+# Location of cached, already parsed specification models
+SPECIFICATION_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'chris_ros_snapshot')
+
+# Layout of the cache files; increment when the cached content changes
+_SPECIFICATION_CACHE_FORMAT = 1
+
+
+def _specification_cache_path(source_folder):
+    """
+    Helper function to get the cache file for a specification folder
+
+    :param source_folder: the input folder of the specification model
+    :type source_folder: str
+    :return: path of the cache file
+    :rtype: str
+    """
+    key = hashlib.sha1(os.path.abspath(source_folder)).hexdigest()
+    return os.path.join(SPECIFICATION_CACHE_DIRECTORY, key + '.pkl')
+
+
+def _specification_signature(source_folder):
+    """
+    Helper function to identify the current state of the specification
+    files in a folder; only files that are read for the specification
+    model are considered, so deployment models saved alongside do not
+    invalidate the cache
+
+    The cache format and tool version are included, so cached models
+    stored by other versions are not used
+
+    :param source_folder: the input folder of the specification model
+    :type source_folder: str
+    :return: the cache format, tool version, and the file names with
+        their modification times and sizes
+    :rtype: tuple
+    """
+    input_type, base_file_name = get_input_file_type(source_folder)
+    signature = [(_SPECIFICATION_CACHE_FORMAT, _VERSION)]
+    for spec_type in ROSModel.SPECIFICATION_TYPES:
+        file_name = os.path.join(source_folder, '{}_{}.{}'.format(
+            base_file_name, ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[spec_type], input_type))
+        try:
+            stat = os.stat(file_name)
+            signature.append((file_name, stat.st_mtime, stat.st_size))
+        except OSError:
+            signature.append((file_name, None, None))
+    return tuple(signature)
+
+
+def clear_specification_cache():
+    """
+    Remove all cached specification models
+    """
+    if os.path.isdir(SPECIFICATION_CACHE_DIRECTORY):
+        Logger.get_logger().log(LoggerLevel.INFO,
+                                'Clearing specification cache {} ...'.format(SPECIFICATION_CACHE_DIRECTORY))
+        shutil.rmtree(SPECIFICATION_CACHE_DIRECTORY)
+
+
+def _load_cached_specification_model(source_folder):
+    """
+    Helper function to load a specification model, using the cached
+    copy if the specification files are unchanged since it was stored
+
+    :param source_folder: the input folder pointing to either yaml or pickle files
+    :type source_folder: str
+    :return: the specification model
+    :rtype: ROSModel
+    """
+    try:
+        signature = _specification_signature(source_folder)
+    except (IOError, ValueError):
+        # Let the model loader report the invalid folder
+        return ROSModel.load_model(source_folder, True)
+
+    cache_path = _specification_cache_path(source_folder)
+    try:
+        with open(cache_path, 'rb') as fin:
+            cached_signature, cached_model = pickle.load(fin)
+        if cached_signature == signature:
+            Logger.get_logger().log(LoggerLevel.INFO, 'Using cached specification model {} ...'.format(cache_path))
+            return cached_model
+    except IOError as ex:
+        Logger.get_logger().log(LoggerLevel.DEBUG, 'No specification cache {}: {}'.format(cache_path, ex))
+    except Exception as ex:  # pylint: disable=broad-except
+        # Stale caches may fail in many ways on unpickling; reload the specification files instead
+        Logger.get_logger().log(LoggerLevel.WARNING,
+                                'Ignoring unusable specification cache {}: {}'.format(cache_path, ex))
+
+    ros_model = ROSModel.load_model(source_folder, True)
+    if ros_model is not None:
+        _store_cached_specification_model(source_folder, ros_model, signature)
+    return ros_model
+
+
+def _store_cached_specification_model(source_folder, ros_model, signature=None):
+    """
+    Helper function to cache a specification model matching the
+    current specification files in a folder
+
+    :param source_folder: the input folder pointing to either yaml or pickle files
+    :type source_folder: str
+    :param ros_model: the specification model
+    :type ros_model: ROSModel
+    :param signature: the signature of the specification files, if known
+    :type signature: tuple
+    """
+    cache_path = _specification_cache_path(source_folder)
+    try:
+        if signature is None:
+            signature = _specification_signature(source_folder)
+        create_directory_path(SPECIFICATION_CACHE_DIRECTORY)
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as fout:
+            pickle.dump((signature, ros_model), fout, pickle.HIGHEST_PROTOCOL)
+        os.rename(temp_path, cache_path)
+    except (IOError, OSError, ValueError, pickle.PicklingError) as ex:
+        Logger.get_logger().log(LoggerLevel.WARNING, 'Failed to cache specification model: {}'.format(ex))
+
+
+def _log_exception_details(ex):
+    """
+    Helper function to log the type, message, and traceback of an
+    exception at DEBUG level
+
+    :param ex: the exception being handled
+    :type ex: Exception
+    """
+    logger = Logger.get_logger()
+    if logger.is_enabled_for(LoggerLevel.DEBUG):
+        logger.log(LoggerLevel.DEBUG, '{}\n{}\n{}'.format(type(ex), ex, traceback.format_exc()))
+
 
 class ROSSnapshot(object):
     """
@@ -36,7 +176,7 @@ class ROSSnapshot(object):
         """
         Instantiates an instance of the ROSSnapshot
         """
-        self._master = ROSUtilities.get_ros_utilities().master
+        self._master = get_ros_utilities().master
         self._ros_model_builder = None
         self._ros_deployment_model = None
         self._ros_specification_model = None
@@ -150,7 +290,7 @@ class ROSSnapshot(object):
         """
 
         try:
-            self._ros_specification_model = ROSModel.load_model(source_folder, True)
+            self._ros_specification_model = _load_cached_specification_model(source_folder)
         except Exception as ex:
             print type(ex)
             print ex
@@ -164,7 +304,7 @@ class ROSSnapshot(object):
         for spec_type in ROSModel.SPECIFICATION_TYPES:
             try:
                 spec = self._ros_specification_model[spec_type]
-                if spec is None or len(spec.keys) < 1:
+                if spec is None or len(spec) < 1:
                     Logger.get_logger().log(LoggerLevel.ERROR,
                                             'Specification model {} is invalid !'.format(ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[spec_type]))
                     missing_spec = True
@@ -205,6 +345,9 @@ class ROSSnapshot(object):
     def _create_spec_remappers(self):
         """
         Create dictionary of remappers between spec banks
+
+        The 'node_remapper' maps the full node executable file paths,
+        their base names, and the node spec names to the node spec name
         """
 
         # Build dictionary to allow remapping of information
@@ -212,15 +355,16 @@ class ROSSnapshot(object):
 
         # node exe to package/node data
         node_spec = self.ros_specification_model[BankType.NODE_SPECIFICATION]
+        pairs = []
+        for spec in node_spec.values:
+            file_paths = spec.file_path if isinstance(spec.file_path, list) else [spec.file_path]
+            for file_path in file_paths:
+                if file_path:
+                    pairs.append((file_path, spec.name))
+                    pairs.append((os.path.basename(file_path), spec.name))
+            pairs.append((spec.name, spec.name))
         remappers['node_remapper'] = RemapperBank()
-
-        node_remapper = remappers['node_remapper']
-        for _, spec in node_spec.items:
-            if isinstance(spec.file_path, list):
-                for file_name in spec.file_path:
-                    node_remapper.add_remap(file_name, spec.name)
-            else:
-                node_remapper.add_remap(spec.file_path, spec.name)
+        remappers['node_remapper'].update(pairs)
 
         return remappers
 
@@ -236,34 +380,43 @@ class ROSSnapshot(object):
             try:
                 if node_builder.is_nodelet:
                     # @todo Validate a standard nodelet
-                    print "\n\n skipping validation for nodelet ", key, "\n\n"
+                    Logger.get_logger().log(LoggerLevel.DEBUG, '   Skipping validation for nodelet %s', key)
                 elif node_builder.is_nodelet_manager:
                     # @todo Validate a standard nodelet manager
-                    print "\n\n skipping validation for nodelet manager ", key, "\n\n"
+                    Logger.get_logger().log(LoggerLevel.DEBUG, '   Skipping validation for nodelet manager %s', key)
                 else:
                     # Validate a standard node
                     node_spec = None
                     node_spec_remap = None
+                    executable_name = node_builder.executable_name
                     file_name = node_builder.executable_file
-                    if node_builder.executable_name[:6] == "python":
+                    if executable_name.startswith("python"):
                         # Allow for python, python2, or python3 as executable_name
                         try:
                             file_name = node_builder.executable_cmdline[1]
                         except IndexError:
                             pass
 
-                    try:
-                        node_spec_remap = node_remapper[file_name]
-                    except KeyError:
-                        try:
-                            # Last ditch try using plain executable_name
-                            node_spec_remap = node_remapper[node_builder.executable_name]
-                        except KeyError:
-                            pass
+                    # Try the full path, then the base name alias, then the plain executable_name
+                    ambiguous = None
+                    for alias in (file_name, os.path.basename(file_name) if file_name else None, executable_name):
+                        if not alias:
+                            continue
+                        remap = node_remapper.get(alias)
+                        if isinstance(remap, list):
+                            # Several specs share this name, so keep looking
+                            if ambiguous is None:
+                                ambiguous = (alias, remap)
+                        elif remap is not None:
+                            node_spec_remap = remap
+                            break
+
+                    if node_spec_remap is None and ambiguous is not None:
+                        Logger.get_logger().log(LoggerLevel.WARNING,
+                                                '   Node %s executable %s matches several specs %s !',
+                                                key, ambiguous[0], ambiguous[1])
 
                     if node_spec_remap is not None:
-                        # print "     found node spec ", file_name, node_remapper[file_name]
-
                         # Update builder with information from specification
                         node_builder.set_node_name(node_spec_remap)
 
@@ -277,24 +430,14 @@ class ROSSnapshot(object):
                                 # Node has not been validated, so get spec info from this node
                                 self._update_node_specification(node_spec, node_builder)
 
-                        except KeyError as ex:
-                            raise ex
                         except Exception as ex:
-                            Logger.get_logger().log(LoggerLevel.ERROR, '   Failed to validate node {}  {}  !'.format(key, node_spec_remap))
-                            print type(ex)
-                            print ex
-                            track = traceback.format_exc()
-                            print track
-                            sys.exit(-1) # debug
+                            Logger.get_logger().log(LoggerLevel.ERROR, '   Failed to validate node %s  %s  !', key, node_spec_remap)
+                            _log_exception_details(ex)
                     else:
-                        Logger.get_logger().log(LoggerLevel.ERROR, '   Unkown node {} executable {} . Skip validation !'.format(key, file_name))
+                        Logger.get_logger().log(LoggerLevel.ERROR, '   Unkown node %s executable %s . Skip validation !', key, file_name)
             except Exception as ex:
-                Logger.get_logger().log(LoggerLevel.ERROR, '   Failed to process node {}  {}  !'.format(key, file_name))
-                print type(ex)
-                print ex
-                track = traceback.format_exc()
-                print track
-                sys.exit(-1) # debug
+                Logger.get_logger().log(LoggerLevel.ERROR, '   Failed to process node %s  %s  !', key, file_name)
+                _log_exception_details(ex)
 
     @staticmethod
     def _match_token_types(node_name, io_names, io_builders, spec_types):
@@ -315,47 +458,52 @@ class ROSSnapshot(object):
                 # We have action clients to match up in the spec
                 available_tokens = set(spec_types)
                 io_is_valid = True
+
+                # First resolve the names whose token matches directly
+                unresolved = []
                 for io_name in sorted(io_names):
-                    builder = io_builders[io_name]
-                    io_type = builder.construct_type
-                    token = io_name.split("/")[-1]
-
-                    if token not in available_tokens or io_type != spec_types[token]:
-                        # look from matching item remaining tokens
-
-                        # prefer substring match
-                        potential = set([ss for ss in available_tokens if token in ss])
-                        remaining = available_tokens - potential
-                        for test in sorted(potential):
-                            if spec_types[test] == io_type:
-                                # found match
-                                io_names[io_name] = test
-                                available_tokens.remove(test)
-                                break
-                        if io_names[io_name] is None:
-                            for test in sorted(remaining):
-                                if spec_types[test] == io_type:
-                                    # found match
-                                    io_names[io_name] = test
-                                    available_tokens.remove(test)
-                                    break
-                        if io_names[io_name] is None:
-                            # If still None, then no match found
-                            Logger.get_logger().log(LoggerLevel.WARNING, '      Node {} unmatched data {} !'.format(node_name, io_name))
-                            io_is_valid = False
-                    else:
+                    io_type = io_builders[io_name].construct_type
+                    token = io_name.rpartition("/")[2]
+                    if token in available_tokens and io_type == spec_types[token]:
                         # Found valid match
                         io_names[io_name] = token
                         available_tokens.remove(token)
+                    else:
+                        unresolved.append((io_name, io_type, token))
+
+                # Then look for the others among the remaining tokens
+                # (sorted once; candidates are tried in this order)
+                ordered_tokens = sorted(available_tokens) if unresolved else ()
+                for io_name, io_type, token in unresolved:
+                    # look from matching item remaining tokens in a
+                    # single pass, preferring a substring match
+                    matched = None
+                    fallback = None
+                    for test in ordered_tokens:
+                        if test not in available_tokens or spec_types[test] != io_type:
+                            continue
+                        if token in test:
+                            matched = test
+                            break
+                        if fallback is None:
+                            fallback = test
+                    if matched is None:
+                        matched = fallback
+
+                    if matched is None:
+                        # No match found
+                        Logger.get_logger().log(LoggerLevel.WARNING, '      Node %s unmatched data %s !', node_name, io_name)
+                        io_is_valid = False
+                    else:
+                        io_names[io_name] = matched
+                        available_tokens.remove(matched)
 
                 return io_is_valid
 
         except Exception as ex:
-            print type(ex)
-            print ex
-            track = traceback.format_exc()
-            print track
-            sys.exit(-1)
+            Logger.get_logger().log(LoggerLevel.ERROR, '      Node %s failed to match data !', node_name)
+            _log_exception_details(ex)
+            return False
 
     def _validate_node_builder(self, node_name, node_builder, node_spec):
         """
@@ -366,61 +514,66 @@ class ROSSnapshot(object):
         :return: True if all matches up; false if any mismatches
         """
         node_is_valid = True
+        get_bank_builder = self._ros_model_builder.get_bank_builder
+        parameter_bank_builder = get_bank_builder(BankType.PARAMETER)
+        action_bank_builder = get_bank_builder(BankType.ACTION)
+        topic_bank_builder = get_bank_builder(BankType.TOPIC)
+        service_bank_builder = get_bank_builder(BankType.SERVICE)
 
-        Logger.get_logger().log(LoggerLevel.INFO, ' Validating Node {} ...'.format(node_name))
+        Logger.get_logger().log(LoggerLevel.INFO, ' Validating Node %s ...', node_name)
         # Spec should define more parameters than we either read or write
         if len(node_spec.parameters) < len(node_builder.read_parameter_names):
             Logger.get_logger().log(LoggerLevel.WARNING,
-                                    '      Node {} incorrect number of parameters to read ({} vs. {})!'.format(
-                                        node_name, len(node_builder.read_parameter_names), len(node_spec.parameters.keys())))
-            print "     Spec parameters: \n", node_spec.parameters
-            print "     Node read parameters:\n", node_builder.read_parameter_names
+                                    '      Node %s incorrect number of parameters to read (%d vs. %d)!',
+                                    node_name, len(node_builder.read_parameter_names), len(node_spec.parameters))
+            Logger.get_logger().log(LoggerLevel.DEBUG, '     Spec parameters: \n%s\n     Node read parameters:\n%s',
+                                    node_spec.parameters, node_builder.read_parameter_names)
             node_is_valid = False
 
         if len(node_spec.parameters) < len(node_builder.set_parameter_names):
             Logger.get_logger().log(LoggerLevel.WARNING,
-                                    '      Node {} incorrect number of parameters to set ({} vs. {})!'.format(
-                                        node_name, len(node_builder.set_parameter_names), len(node_spec.parameters.keys())))
-            print "     Spec parameters: \n", node_spec.parameters
-            print "     Node read parameters:\n", node_builder.set_parameter_names
+                                    '      Node %s incorrect number of parameters to set (%d vs. %d)!',
+                                    node_name, len(node_builder.set_parameter_names), len(node_spec.parameters))
+            Logger.get_logger().log(LoggerLevel.DEBUG, '     Spec parameters: \n%s\n     Node set parameters:\n%s',
+                                    node_spec.parameters, node_builder.set_parameter_names)
             node_is_valid = False
 
         # All parameter names once
         parameters = node_spec.parameters # names to types
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.read_parameter_names,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.PARAMETER),
+                                                                  parameter_bank_builder,
                                                                   parameters)
 
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.set_parameter_names,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.PARAMETER),
+                                                                  parameter_bank_builder,
                                                                   parameters)
 
         # Do we define the proper action clients
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.action_clients,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.ACTION),
+                                                                  action_bank_builder,
                                                                   node_spec.action_clients)
 
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.action_servers,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.ACTION),
+                                                                  action_bank_builder,
                                                                   node_spec.action_servers)
 
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.published_topic_names,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.TOPIC),
+                                                                  topic_bank_builder,
                                                                   node_spec.published_topics)
 
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.subscribed_topic_names,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.TOPIC),
+                                                                  topic_bank_builder,
                                                                   node_spec.subscribed_topics)
 
         node_is_valid = node_is_valid and self._match_token_types(node_name,
                                                                   node_builder.service_names_with_remap,
-                                                                  self._ros_model_builder.get_bank_builder(BankType.SERVICE),
+                                                                  service_bank_builder,
                                                                   node_spec.services_provided)
 
         return node_is_valid
@@ -433,18 +586,16 @@ class ROSSnapshot(object):
         :param builder_data: data from node builder
         :param item_builders: builder list for type
         """
-        token_map = {name:0 for name in spec_data}
+        token_map = defaultdict(int)
         for spec_name in sorted(builder_data):
             builder = item_builders[spec_name]
             spec_type = builder.construct_type
-            spec_token = spec_name.split("/")[-1]
+            spec_token = spec_name.rpartition("/")[2]
 
             if spec_token in spec_data:
                 # Just store as string unless multiple
                 token_map[spec_token] += 1
-                spec_token += "_" + str(token_map[spec_token])
-            else:
-                token_map[spec_token] = 0
+                spec_token = "%s_%d" % (spec_token, token_map[spec_token])
 
             spec_data[spec_token] = spec_type
             builder_data[spec_name] = spec_token
@@ -459,50 +610,56 @@ class ROSSnapshot(object):
         """
         assert not node_spec.validated
         self.specification_update = True
+        get_bank_builder = self._ros_model_builder.get_bank_builder
+        parameter_bank_builder = get_bank_builder(BankType.PARAMETER)
+        action_bank_builder = get_bank_builder(BankType.ACTION)
+        topic_bank_builder = get_bank_builder(BankType.TOPIC)
+        service_bank_builder = get_bank_builder(BankType.SERVICE)
 
         # Parameters (merge read and set into single dictionary)
         parameters = node_spec.parameters # names to types
         if parameters is None:
             parameters = {}
-        self._update_node_specification_data(parameters, node_builder.read_parameter_names,
-                                             self._ros_model_builder.get_bank_builder(BankType.PARAMETER))
-
-        set_parameters = node_spec.parameters # names to types
-        if set_parameters is None:
-            set_parameters = {}
-        self._update_node_specification_data(set_parameters, node_builder.set_parameter_names,
-                                             self._ros_model_builder.get_bank_builder(BankType.PARAMETER))
-        parameters.update(set_parameters)
+        read_parameter_names = node_builder.read_parameter_names
+        set_parameter_names = node_builder.set_parameter_names
+        parameter_names = dict(read_parameter_names)
+        parameter_names.update(set_parameter_names)
+        self._update_node_specification_data(parameters, parameter_names, parameter_bank_builder)
+        # Store the assigned tokens with both the read and set names
+        for parameter_name in read_parameter_names:
+            read_parameter_names[parameter_name] = parameter_names[parameter_name]
+        for parameter_name in set_parameter_names:
+            set_parameter_names[parameter_name] = parameter_names[parameter_name]
 
         action_clients = node_spec.action_clients
         if action_clients is None:
             action_clients = {}
         self._update_node_specification_data(action_clients, node_builder.action_clients,
-                                             self._ros_model_builder.get_bank_builder(BankType.ACTION))
+                                             action_bank_builder)
 
         action_servers = node_spec.action_servers
         if action_servers is None:
             action_servers = {}
         self._update_node_specification_data(action_servers, node_builder.action_servers,
-                                             self._ros_model_builder.get_bank_builder(BankType.ACTION))
+                                             action_bank_builder)
 
         published_topics = node_spec.published_topics
         if published_topics is None:
             published_topics = {}
         self._update_node_specification_data(published_topics, node_builder.published_topic_names,
-                                             self._ros_model_builder.get_bank_builder(BankType.TOPIC))
+                                             topic_bank_builder)
 
         subscribed_topics = node_spec.subscribed_topics
         if subscribed_topics is None:
             subscribed_topics = {}
         self._update_node_specification_data(subscribed_topics, node_builder.subscribed_topic_names,
-                                             self._ros_model_builder.get_bank_builder(BankType.TOPIC))
+                                             topic_bank_builder)
 
         services_provided = node_spec.services_provided
         if services_provided is None:
             services_provided = {}
         self._update_node_specification_data(services_provided, node_builder.service_names_with_remap,
-                                             self._ros_model_builder.get_bank_builder(BankType.SERVICE))
+                                             service_bank_builder)
 
         # Update the specification to include I/O data
         node_spec.update_attributes(validated=True,
@@ -549,11 +706,12 @@ class ROSSnapshot(object):
         :type state_information: tuple(dict{str: list[str]}, dict{str: list[str]}, dict{str: list[str]})
         """
         publishers, subscribers, services = state_information
-        self._collect_node_info(publishers, subscribers)
-        self._collect_services_info(services)
+        node_bank = self.node_bank
+        self._collect_node_info(publishers, subscribers, self.topic_bank, node_bank)
+        self._collect_services_info(services, self.service_bank, node_bank)
         self._collect_parameters_info()
 
-    def _collect_node_info(self, publishers, subscribers):
+    def _collect_node_info(self, publishers, subscribers, topic_bank, node_bank):
         """
         Helper method to collect Publisher and Subscriber Node
         information (including Topic names)
@@ -564,29 +722,44 @@ class ROSSnapshot(object):
         :param subscribers: dictionary of Subscribed Topic names to Node
             names
         :type subscribers: dict{str: list[str]}
+        :param topic_bank: the TopicBankBuilder to populate
+        :type topic_bank: TopicBankBuilder
+        :param node_bank: the NodeBankBuilder to populate
+        :type node_bank: NodeBankBuilder
         """
-        self._create_nodes_with_topics(publishers, 'published')
-        self._create_nodes_with_topics(subscribers, 'subscribed')
+        self._create_nodes_with_topics(publishers, subscribers, topic_bank, node_bank)
 
-    def _create_nodes_with_topics(self, state_information, status):
+    @staticmethod
+    def _create_nodes_with_topics(publishers, subscribers, topic_bank, node_bank):
         """
         Helper method to create NodeBuilders and TopicBuilders within
         the ROSModelBuilder's NodeBankBuilder and TopicBankBuilder,
-        respectively
-
-        :param state_information: Topic names to Node names
-        :type state_information: dict{str: list[str]}
-        :param status: Identifier to indicate whether data are for
-            publishers or subscribers
-        :type status: str
+        respectively; each Topic is visited once for both its
+        publishers and subscribers
+
+        :param publishers: Published Topic names to Node names
+        :type publishers: list[tuple(str, list[str])]
+        :param subscribers: Subscribed Topic names to Node names
+        :type subscribers: list[tuple(str, list[str])]
+        :param topic_bank: the TopicBankBuilder to populate
+        :type topic_bank: TopicBankBuilder
+        :param node_bank: the NodeBankBuilder to populate
+        :type node_bank: NodeBankBuilder
         """
-        for topic_name, node_names in state_information:
-            collected_topic = self.topic_bank[topic_name]
-            for node_name in node_names:
-                collected_topic.add_node_name(node_name, status)
-                self.node_bank[node_name].add_topic_name(topic_name, status, collected_topic.construct_type, None)
+        publishers = dict(publishers)
+        subscribers = dict(subscribers)
+        should_filter_out = filters.TopicFilter.get_filter().should_filter_out
+        for topic_name in set(publishers).union(subscribers):
+            collected_topic = topic_bank[topic_name]
+            topic_type = collected_topic.construct_type
+            for status, node_names in (('published', publishers.get(topic_name, ())),
+                                       ('subscribed', subscribers.get(topic_name, ()))):
+                for node_name in node_names:
+                    collected_topic.add_node_name(node_name, status)
+                    node_bank[node_name].add_topic_name(topic_name, status, topic_type, None, should_filter_out)
 
-    def _collect_services_info(self, state_information):
+    @staticmethod
+    def _collect_services_info(state_information, service_bank, node_bank):
         """
         Helper method to create NodeBuilders and ServiceBuilders within
         the ROSModelBuilder's NodeBankBuilder and ServiceBankBuilder,
@@ -594,12 +767,26 @@ class ROSSnapshot(object):
 
         :param state_information: Service names to Node names
         :type state_information: dict{str: list[str]}
+        :param service_bank: the ServiceBankBuilder to populate
+        :type service_bank: ServiceBankBuilder
+        :param node_bank: the NodeBankBuilder to populate
+        :type node_bank: NodeBankBuilder
         """
+        collected_services = []
         for service_name, service_provider_names in state_information:
-            collected_service = self.service_bank[service_name]
+            collected_service = service_bank[service_name]
             for node_name in service_provider_names:
                 collected_service.add_service_provider_node_name(node_name)
-                self.node_bank[node_name].add_service_name_and_type(service_name, collected_service.construct_type)
+            collected_services.append((collected_service, service_provider_names))
+
+        # Service types come from the handshake headers, so probe all Services at once
+        service_bank.probe_all()
+        should_filter_out = filters.ServiceTypeFilter.get_filter().should_filter_out
+        for collected_service, service_provider_names in collected_services:
+            service_type = collected_service.construct_type
+            for node_name in service_provider_names:
+                node_bank[node_name].add_service_name_and_type(collected_service.name, service_type,
+                                                                should_filter_out)
 
     def _collect_parameters_info(self):
         """
@@ -607,30 +794,76 @@ class ROSSnapshot(object):
         ROSModelBuilder's ParameterBankBuilder and to map parameters to
         associated NodeBuilders (obtained from the ROS Master API)
         """
-        for parameter_name in self._master.getParamNames():
-            # Initialize parameter bank for each parameter name
-            self.parameter_bank[parameter_name]  # pylint: disable=W0104
+        parameter_names, setting_callers, reading_callers = self._fetch_parameter_callers()
 
-        try:
-            for parameter_name, node_names in self._master.getParamsToSettingCallers().items():
-                for node_name in node_names:
-                    if (node_name == '/roslaunch') or (not filters.NodeFilter.get_filter().should_filter_out(node_name)):
-                        self.parameter_bank[parameter_name].add_setting_node_name(node_name)
-                    if not filters.NodeFilter.get_filter().should_filter_out(node_name):
-                        self.node_bank[node_name].add_parameter_name(parameter_name, 'set', None)
-            for parameter_name, node_names in self._master.getParamsToReadingCallers().items():
-                for node_name in node_names:
-                    if (node_name == '/roslaunch') or not filters.NodeFilter.get_filter().should_filter_out(node_name):
-                        self.parameter_bank[parameter_name].add_reading_node_name(node_name)
-                    if not filters.NodeFilter.get_filter().should_filter_out(node_name):
-                        self.node_bank[node_name].add_parameter_name(parameter_name, 'read', None)
+        parameter_bank = self.parameter_bank
+        # Initialize parameter bank for each parameter name
+        parameter_bank.bulk_init(parameter_names)
 
-        except AttributeError:
+        if setting_callers is None or reading_callers is None:
             msg = '\n  Standard roscore does NOT provide parameter setting/reading information!\n' + \
                     '     Use custom roscore if desired.\n' + \
                     '     See chris_ros_snapshot README for more info!'
 
             Logger.get_logger().log(LoggerLevel.WARNING, msg)
+            return
+
+        node_bank = self.node_bank
+        should_filter_out = filters.NodeFilter.get_filter().should_filter_out
+        # Node names recur across Parameters, so decide each one once:
+        # (keep for Parameter, keep for Node)
+        node_decisions = {}
+
+        def decide(node_name):
+            decision = node_decisions.get(node_name)
+            if decision is None:
+                keep_node = not should_filter_out(node_name)
+                decision = ((node_name == '/roslaunch') or keep_node, keep_node)
+                node_decisions[node_name] = decision
+            return decision
+
+        # Parameter names grouped by Node name and status
+        nodes_to_parameter_names = {}
+        for status, parameter_callers in (('set', setting_callers), ('read', reading_callers)):
+            for parameter_name, node_names in parameter_callers.items():
+                parameter_node_names = []
+                for node_name in node_names:
+                    keep_for_parameter, keep_for_node = decide(node_name)
+                    if keep_for_parameter:
+                        parameter_node_names.append(node_name)
+                    if keep_for_node:
+                        if node_name not in nodes_to_parameter_names:
+                            nodes_to_parameter_names[node_name] = {'set': [], 'read': []}
+                        nodes_to_parameter_names[node_name][status].append(parameter_name)
+                if parameter_node_names:
+                    if status == 'set':
+                        parameter_bank[parameter_name].add_setting_node_names(parameter_node_names)
+                    else:
+                        parameter_bank[parameter_name].add_reading_node_names(parameter_node_names)
+
+        for node_name, statuses_to_parameter_names in nodes_to_parameter_names.items():
+            node_builder = node_bank[node_name]
+            for status, parameter_names in statuses_to_parameter_names.items():
+                if parameter_names:
+                    node_builder.add_parameter_names(parameter_names, status)
+
+    def _fetch_parameter_callers(self):
+        """
+        Helper method to retrieve the Parameter names and the names of
+        the ROS Nodes setting and reading them from the ROS Master; the
+        caller queries are only provided by the custom ROS Master API
+
+        :return: the Parameter names, Parameter names to setting Node
+            names, and Parameter names to reading Node names; the
+            latter two are None if the ROS Master does not provide them
+        :rtype: tuple(list[str], dict{str: list[str]}, dict{str: list[str]})
+        """
+        parameter_names = self._master.getParamNames()
+        try:
+            return (parameter_names, self._master.getParamsToSettingCallers(),
+                    self._master.getParamsToReadingCallers())
+        except AttributeError:
+            return parameter_names, None, None
 
 
     def print_statistics(self):
@@ -640,17 +873,17 @@ class ROSSnapshot(object):
         print "     --- Specifications ---"
         for bank_type in ROSModel.SPECIFICATION_TYPES:
             bank = self._ros_specification_model[bank_type]
-            print "     {:4d}  items in {}".format(len(bank.keys), ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type])
+            print "     {:4d}  items in {}".format(len(bank), ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type])
 
         print "     --- Deployment ---"
         for bank_type in ROSModel.DEPLOYMENT_TYPES:
             bank = self._ros_deployment_model[bank_type]
-            print "     {:4d} items in {}".format(len(bank.keys), ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type])
+            print "     {:4d} items in {}".format(len(bank), ROSModel.BANK_TYPES_TO_OUTPUT_NAMES[bank_type])
 
-def get_options(argv):
+def _create_parser():
     """
-    Handle command line options
-    :param argv: command arguments
+    Create the command line parser; built once at import
+    :return: argument parser
     """
     #pylint: disable=line-too-long
     #pylint: disable=bad-whitespace
@@ -663,20 +896,52 @@ def get_options(argv):
     parser.add_argument("-a", "--all",        dest="all",     default=False, action="store_true",          help="output all possible formats")
     parser.add_argument("-t", "--target",     dest="target",  default="output", type=str, action="store", help="target output directory (default='output')")
     parser.add_argument("-r", "--human",      dest="human",   default=None, type=str, action="store",  help="output human readable text format to directory (default=None)")
-    parser.add_argument("-y", "--yaml",       dest="yaml",    default="yaml", type=str, action="store",  help="output yaml format to directory (default=`yaml`)")
-    parser.add_argument("-p", "--pickle",     dest="pickle",  default="pickle", type=str, action="store",  help="output pickle format to directory (default='pickle')")
+    parser.add_argument("-y", "--yaml",       dest="yaml",    default=None, type=str, action="store",  help="output yaml format to directory (default=`yaml`, unless only --pickle is given)")
+    parser.add_argument("-p", "--pickle",     dest="pickle",  default=None, type=str, action="store",  help="output pickle format to directory (default='pickle')")
     parser.add_argument("-g", "--graph",      dest="graph",   default=None, type=str, action="store",  help="output dot format for computation graph to directory (default=None)")
     parser.add_argument("-d", "--display",    dest="display", default=False, action="store_true",          help="display computation graph pdf (default=False) (only if output)")
     parser.add_argument("-b", "--base",       dest="base",    default="ros_model", type=str, action="store", help="output base file name (default='ros_snapshot')")
     parser.add_argument("-s", "--spec-input", dest="spec",    default="output/yaml", type=str, action="store", help="specification model input folder (default='output/yaml')")
     parser.add_argument("-v", "--version",    dest="version", default=False, action="store_true",          help="display version information")
+    parser.add_argument("--archive",          dest="archive", default=False, action="store_true",          help="save yaml, pickle, and human output in one <base>.tar.gz archive in the target directory (default=False)")
+    parser.add_argument("--clear-cache",      dest="clear_cache", default=False, action="store_true",      help="clear cached specification models before loading (default=False)")
     parser.add_argument('-lt', '--logger_threshold', dest='logger_threshold',
                         choices={'ERROR': LoggerLevel.ERROR, 'WARNING': LoggerLevel.WARNING,
                                  'INFO': LoggerLevel.INFO, 'DEBUG': LoggerLevel.DEBUG},
                         default='INFO',
                         help='logger threshold (default=`INFO`)')
+    return parser
+
+
+def _read_version():
+    """
+    Read the package version from the VERSION file; read once at import
+    :return: version string, or None if the VERSION file is not available
+    """
+    file_name = os.path.join(os.path.dirname(__file__), "..", "..", "VERSION")
+    try:
+        with open(file_name) as fin:
+            return fin.read()
+    except IOError:
+        return None
+
+
+_PARSER = _create_parser()
+_VERSION = _read_version()
+
+
+def get_options(argv):
+    """
+    Handle command line options
+    :param argv: command arguments
+    """
+    options, _ = _PARSER.parse_known_args(argv)
 
-    options, _ = parser.parse_known_args(argv)
+    # YAML output is slow for large models, so skip it if only pickle output is requested
+    if options.yaml is None and options.pickle is None:
+        options.yaml = "yaml"
+    if options.pickle is None:
+        options.pickle = "pickle"
 
     if options.all:
         if options.human is None:
@@ -692,6 +957,53 @@ def get_options(argv):
     return options
 
 
+def prepare_output_directories(options, output_formats=('yaml', 'pickle', 'human', 'graph')):
+    """
+    Create each requested output directory once, before any files are saved
+    :param options: command line options
+    :param output_formats: output formats written as directories
+    :return: dictionary of output format ('yaml', 'pickle', 'human', 'graph') to directory path
+    """
+    output_directories = {}
+    for output_format in output_formats:
+        output_folder = getattr(options, output_format)
+        if output_folder is not None:
+            output_directories[output_format] = os.path.join(options.target, output_folder)
+
+    for directory_path in set(output_directories.values()):
+        create_directory_path(directory_path)
+
+    return output_directories
+
+
+def save_output_archive(options, deployment_model, specification_model):
+    """
+    Save the requested yaml, pickle, and human-readable output into a single
+    compressed archive in the target directory, instead of one file per bank
+    :param options: command line options
+    :param deployment_model: the deployment ROSModel
+    :param specification_model: the updated specification ROSModel, or None
+    :return: None
+    """
+    create_directory_path(options.target)
+    archive_name = os.path.join(options.target, '{}.tar.gz'.format(options.base))
+    Logger.get_logger().log(LoggerLevel.INFO, 'Saving output archive {}.'.format(archive_name))
+    try:
+        # Fast compression; the archive mainly saves per-file overhead
+        with tarfile.open(archive_name, 'w:gz', compresslevel=1) as tar_file:
+            for ros_model in (deployment_model, specification_model):
+                if ros_model is None:
+                    continue
+                if options.yaml is not None:
+                    ros_model.save_model_yaml_to_tar(tar_file, options.yaml, options.base)
+                if options.pickle is not None:
+                    ros_model.save_model_pickle_to_tar(tar_file, options.pickle, options.base)
+                if options.human is not None:
+                    ros_model.save_model_info_to_tar(tar_file, options.human, options.base)
+    except (IOError, tarfile.TarError) as ex:
+        Logger.get_logger().log(LoggerLevel.ERROR, 'Failed to save output archive {}.'.format(archive_name))
+        print "     ", ex
+
 
 def main(argv):
     """
@@ -705,25 +1017,25 @@ def main(argv):
     # print " argv=", argv
 
     if options.version:
-        file_name = os.path.join(os.path.dirname(__file__), "..", "..", "VERSION")
-        with open(file_name) as fin:
-            version = fin.read()
-        print "chris_ros_snapshot version: ", version
+        print "chris_ros_snapshot version: ", _VERSION if _VERSION is not None else "unknown"
         print "   NOTE: Check chris_ros_modeling version using model_loader --version"
 
         sys.exit(0)
 
     Logger.LEVEL = options.logger_threshold
-    ROSUtilities.get_ros_utilities('/'+options.base)  # initialize with node name
-    filters.NodeFilter.BASE_EXCLUSIONS.add(ROSUtilities.get_ros_utilities().node_name)
+    get_ros_utilities('/'+options.base)  # initialize with node name
+    filters.NodeFilter.add_base_exclusion(get_ros_utilities().node_name)
     filters.Filter.FILTER_OUT_DEBUG = True
     filters.Filter.FILTER_OUT_TF = False
 
     start_time = time.time()
     Logger.get_logger().log(LoggerLevel.INFO,
-                            'Initializing ROS Snapshot tool {} ...'.format(ROSUtilities.get_ros_utilities().node_name))
+                            'Initializing ROS Snapshot tool {} ...'.format(get_ros_utilities().node_name))
     snapshot = ROSSnapshot()
 
+    if options.clear_cache:
+        clear_specification_cache()
+
     Logger.get_logger().log(LoggerLevel.INFO, 'Load existing specification model ...')
 
     if not snapshot.load_specifications(options.spec):
@@ -734,23 +1046,45 @@ def main(argv):
         sys.exit(-1)
     else:
         if snapshot.snapshot():
-            if options.yaml is not None:
-                snapshot.ros_deployment_model.save_model_yaml_files(os.path.join(options.target, options.yaml), options.base)
-                if snapshot.specification_update:
-                    snapshot.ros_specification_model.save_model_yaml_files(os.path.join(options.target, options.yaml), options.base)
-
-            if options.pickle is not None:
-                snapshot.ros_deployment_model.save_model_pickle_files(os.path.join(options.target, options.pickle), options.base)
-                if snapshot.specification_update:
-                    snapshot.ros_specification_model.save_model_pickle_files(os.path.join(options.target, options.pickle), options.base)
-
-            if options.human is not None:
-                snapshot.ros_deployment_model.save_model_info_files(os.path.join(options.target, options.human), options.base)
-                if snapshot.specification_update:
-                    snapshot.ros_specification_model.save_model_info_files(os.path.join(options.target, options.human), options.base)
-
-            if options.graph is not None:
-                snapshot.ros_deployment_model.save_dot_graph_files(os.path.join(options.target, options.graph), options.base, show_graph=options.display)
+            deployment_model = snapshot.ros_deployment_model
+            specification_model = snapshot.ros_specification_model if snapshot.specification_update else None
+            if options.archive:
+                # Only the graph is rendered to a directory; other formats go to the archive
+                output_directories = prepare_output_directories(options, ('graph',))
+                save_output_archive(options, deployment_model, specification_model)
+            else:
+                output_directories = prepare_output_directories(options)
+
+            yaml_directory = output_directories.get('yaml')
+            if yaml_directory is not None:
+                deployment_model.save_model_yaml_files(yaml_directory, options.base, create_directory=False)
+                if specification_model is not None:
+                    specification_model.save_model_yaml_files(yaml_directory, options.base, create_directory=False)
+
+            pickle_directory = output_directories.get('pickle')
+            if pickle_directory is not None:
+                deployment_model.save_model_pickle_files(pickle_directory, options.base, create_directory=False)
+                if specification_model is not None:
+                    specification_model.save_model_pickle_files(pickle_directory, options.base, create_directory=False)
+
+            human_directory = output_directories.get('human')
+            if human_directory is not None:
+                deployment_model.save_model_info_files(human_directory, options.base, create_directory=False)
+                if specification_model is not None:
+                    specification_model.save_model_info_files(human_directory, options.base, create_directory=False)
+
+            if specification_model is not None:
+                # Cache the updated specifications if they replaced the input files
+                spec_folder = os.path.abspath(options.spec)
+                for output_directory in (yaml_directory, pickle_directory):
+                    if output_directory is not None and os.path.abspath(output_directory) == spec_folder:
+                        _store_cached_specification_model(options.spec, specification_model)
+                        break
+
+            graph_directory = output_directories.get('graph')
+            if graph_directory is not None:
+                deployment_model.save_dot_graph_files(graph_directory, options.base, show_graph=options.display,
+                                                      create_directory=False)
 
             Logger.get_logger().log(LoggerLevel.INFO, 'Finished snapshot in {:.3f} seconds'.format(time.time()-start_time))
             snapshot.print_statistics()
@@ -13,7 +13,9 @@ Utility class for accessing ROS Utilities from rosgraph, rospack, ...
 @author William R. Drumheller <william.Drumheller.16@cnu.edu>
 """
 
+import collections
 import os.path
+import threading
 
 import rospkg
 import rosgraph
@@ -23,6 +25,66 @@ import rosgraph.names
 import genmsg
 
 
+class _LazyPackagePaths(collections.Mapping):
+    """
+    Mapping of all known package names to paths that resolves the paths
+    of a package when they are first requested
+    """
+
+    def __init__(self, packages, resolve):
+        """
+        :param packages: names of all known packages
+        :param resolve: function returning the paths for a package name
+        """
+        self._packages = frozenset(packages)
+        self._resolve = resolve
+        self._resolved = {}
+
+    def __getitem__(self, package):
+        """
+        Resolve and store paths for a known package
+        :param package: package name
+        :return: package paths
+        """
+        try:
+            return self._resolved[package]
+        except KeyError:
+            if package not in self._packages:
+                raise
+        paths = self._resolve(package)
+        self._resolved[package] = paths
+        return paths
+
+    def __iter__(self):
+        """
+        :return: an iterator over all known package names
+        """
+        return iter(self._packages)
+
+    def __len__(self):
+        """
+        :return: the number of known packages
+        """
+        return len(self._packages)
+
+    def __contains__(self, package):
+        """
+        :param package: package name
+        :return: True if package is known, whether resolved yet or not
+        """
+        return package in self._packages
+
+    def get(self, package, default=None):
+        """
+        :param package: package name
+        :param default: value returned for unknown packages
+        :return: package paths, or default
+        """
+        if package in self._packages:
+            return self[package]
+        return default
+
+
 class ROSUtilities(object):
     """
     Class that handles ROS communication utility interfaces
@@ -31,7 +93,7 @@ class ROSUtilities(object):
 
     def __init__(self):
         self._node_name = '/ros_model'
-        self._master = None
+        self._local = threading.local()
         self._packages = None
         self._rospack = None
         self._message_paths = None
@@ -47,18 +109,19 @@ class ROSUtilities(object):
         """
         print "  Initializing ROS Master with ", node_name
         self._node_name = node_name
-        self._master = rosgraph.Master(self._node_name)
+        self._local.master = rosgraph.Master(self._node_name)
         self._rospack = rospkg.RosPack()
         self._packages = self._rospack.list()
 
-        self._package_paths = {package: self._rospack.get_path(package) for package in self._packages}
+        # Package paths are only looked up once a package is used
+        self._package_paths = _LazyPackagePaths(self._packages, self._rospack.get_path)
 
-        self._message_paths = {package: [os.path.join(self._rospack.get_path(package), 'msg')]
-                               for package in self._packages}
-        self._service_paths = {package: [os.path.join(self._rospack.get_path(package), 'srv')]
-                               for package in self._packages}
-        self._action_paths = {package: [os.path.join(self._rospack.get_path(package), 'action')]
-                              for package in self._packages}
+        self._message_paths = _LazyPackagePaths(
+            self._packages, lambda package: [os.path.join(self._package_paths[package], 'msg')])
+        self._service_paths = _LazyPackagePaths(
+            self._packages, lambda package: [os.path.join(self._package_paths[package], 'srv')])
+        self._action_paths = _LazyPackagePaths(
+            self._packages, lambda package: [os.path.join(self._package_paths[package], 'action')])
         self._context = genmsg.MsgContext.create_default()
 
     @property
@@ -72,10 +135,15 @@ class ROSUtilities(object):
     @property
     def master(self):
         """
-        Get the ROS master
+        Get the ROS master; each thread gets its own reference since the
+        underlying XML-RPC proxy is not safe to share between threads
         :return: master reference
         """
-        return self._master
+        master = getattr(self._local, 'master', None)
+        if master is None:
+            master = rosgraph.Master(self._node_name)
+            self._local.master = master
+        return master
 
     @property
     def rospack(self):
@@ -136,11 +204,26 @@ class ROSUtilities(object):
     @classmethod
     def get_ros_utilities(cls, node_name='/ros_modeling'):
         """
-        Setup ROS Utilities and return instance
+        Setup ROS Utilities and return instance; kept for existing
+        callers, see the module level get_ros_utilities
         :param node_name: name of node for ROS access
         :return: instance of ROS Utilities instance
         """
-        if cls.INSTANCE is None:
-            cls.INSTANCE = cls()
-            cls.INSTANCE._setup(node_name)
-        return cls.INSTANCE
+        return get_ros_utilities(node_name)
+
+
+_INSTANCE = None
+
+
+def get_ros_utilities(node_name='/ros_modeling'):
+    """
+    Setup ROS Utilities and return the shared instance
+    :param node_name: name of node for ROS access
+    :return: instance of ROS Utilities instance
+    """
+    global _INSTANCE
+    if _INSTANCE is None:
+        instance = ROSUtilities()
+        instance._setup(node_name)
+        _INSTANCE = ROSUtilities.INSTANCE = instance
+    return _INSTANCE
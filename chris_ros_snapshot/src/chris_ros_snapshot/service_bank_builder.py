@@ -13,11 +13,16 @@ and populating *EntityBuilders for the purpose of extracting metamodel
 instances
 """
 
+from multiprocessing.pool import ThreadPool
+
 from chris_ros_modeling.utilities import filters
 from chris_ros_modeling.metamodels import ServiceBank
 from chris_ros_snapshot.base_builders import _BankBuilder
 from chris_ros_snapshot.service_builder import ServiceBuilder
 
+# Maximum number of Services to probe for handshake headers at once
+_PROBE_WORKERS = 32
+
 
 class ServiceBankBuilder(_BankBuilder):
     """
@@ -26,6 +31,13 @@ class ServiceBankBuilder(_BankBuilder):
     extracting metamodel instances
     """
 
+    def __init__(self):
+        """
+        Instantiates an instance of the ServiceBankBuilder
+        """
+        super(ServiceBankBuilder, self).__init__()
+        self._probed_names = set()
+
     def _create_entity_builder(self, name):
         """
         Creates and returns a new ServiceBuilder instance
@@ -37,20 +49,58 @@ class ServiceBankBuilder(_BankBuilder):
         """
         return ServiceBuilder(name)
 
-    def _should_filter_out(self, name, entity_builder):
+    def probe_all(self):
         """
-        Indicates whether the given ServiceBuilder (which has a name to
-        identify it) should be filtered out or not
+        Probes all of the internal ServiceBuilders for their handshake
+        headers concurrently, so that the wall time is bounded by the
+        slowest Service rather than the sum over all Services; the
+        headers are kept by each ServiceBuilder for later use, and
+        Services already probed are not probed again
 
-        :param name: the name to identify the ServiceBuilder
-        :type name: str
-        :param entity_builder: the ServiceBuilder to check
-        :type entity_builder: ServiceBuilder
-        :return: True if the ServiceBuilder should be filtered out;
-            False if not
-        :rtype: bool
+        Once a connection to an endpoint is refused or times out, the
+        other Services on that endpoint are skipped; the resolved and
+        unreachable endpoints are forgotten only when new Services are
+        probed
+        """
+        probed_names = self._probed_names
+        service_builders = [service_builder for name, service_builder in self.names_to_entity_builders.iteritems()
+                            if name not in probed_names]
+        if not service_builders:
+            return
+        ServiceBuilder.clear_endpoint_caches()
+        probed_names.update(service_builder.name for service_builder in service_builders)
+        pool = ThreadPool(min(_PROBE_WORKERS, len(service_builders)))
+        try:
+            pool.map(lambda service_builder: service_builder.headers, service_builders)
+        finally:
+            pool.close()
+            pool.join()
+
+    def prepare(self, **kwargs):
+        """
+        Prepares the internal ServiceBuilders for eventual metamodel
+        extraction; the Services are probed up front, since filtering
+        by type requires their handshake headers
+
+        :param kwargs: keyword arguments needed by the underlying
+            ServiceBuilders used in the preparation process
+        :type kwargs: dict{param: value}
+        """
+        self.probe_all()
+        super(ServiceBankBuilder, self).prepare(**kwargs)
+
+    def _get_should_filter_out(self):
+        """
+        Returns the function that indicates whether a given ServiceBuilder
+        (which has a name to identify it) should be filtered out or not;
+        the ServiceTypeFilter is looked up once, rather than per ServiceBuilder
+
+        :return: a function of the name and the ServiceBuilder that returns
+            True if the ServiceBuilder should be filtered out; False if not
+        :rtype: function(str, ServiceBuilder)
         """
-        return filters.ServiceTypeFilter.get_filter().should_filter_out(entity_builder.construct_type)
+        should_filter_out = filters.ServiceTypeFilter.get_filter().should_filter_out
+        return lambda name, entity_builder: should_filter_out(entity_builder.construct_type)
 
     def _create_bank_metamodel(self):
         """
@@ -14,7 +14,9 @@ information and then further populating themselves from that
 information for the purpose of extracting metamodel instances
 """
 
+import errno
 import socket
+import threading
 from cStringIO import StringIO as BufferType
 
 import rosgraph
@@ -22,7 +24,86 @@ import rosgraph
 from chris_ros_modeling.utilities import filters
 from chris_ros_modeling.metamodels import Service
 from chris_ros_snapshot.base_builders import _EntityBuilder
-from chris_ros_snapshot.ros_utilities import ROSUtilities
+from chris_ros_snapshot.ros_utilities import get_ros_utilities
+
+# Resolved socket addresses keyed by (host, port); many Services share a host
+_RESOLVED_ADDRESSES = {}
+
+
+def _resolve_address(host, port):
+    """
+    Helper function to resolve a Service host and port into a TCP socket
+    address, resolving each host and port only once per probe run
+
+    :param host: the host name or address of the Service
+    :type host: str
+    :param port: the port of the Service
+    :type port: int
+    :return: the (family, socket address) to connect to
+    :rtype: tuple(int, tuple)
+    :raises socket.error: if the host cannot be resolved
+    """
+    key = (host, port)
+    address = _RESOLVED_ADDRESSES.get(key)
+    if address is None:
+        family, _, _, _, socket_address = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0]
+        address = (family, socket_address)
+        _RESOLVED_ADDRESSES[key] = address
+    return address
+
+
+# Per-thread handshake buffers; Services are probed from a thread pool
+_HANDSHAKE_BUFFERS = threading.local()
+
+
+def _handshake_buffer():
+    """
+    Helper function to return this thread's handshake read buffer,
+    emptied for reuse, rather than allocating a new buffer per probe
+
+    :return: an empty buffer for reading handshake headers
+    :rtype: cStringIO.OutputType
+    """
+    buffer = getattr(_HANDSHAKE_BUFFERS, 'buffer', None)
+    if buffer is None:
+        buffer = BufferType()
+        _HANDSHAKE_BUFFERS.buffer = buffer
+    else:
+        buffer.seek(0)
+        buffer.truncate(0)
+    return buffer
+
+
+# Seconds to wait for the TCP connection to a Service endpoint
+_CONNECT_TIMEOUT = 0.5
+
+# Seconds to wait for the handshake once connected
+_HANDSHAKE_TIMEOUT = 5.0
+
+# Connection errors that mark a Service endpoint as unreachable
+_UNREACHABLE_ERRNOS = frozenset([errno.ECONNREFUSED, errno.EHOSTUNREACH])
+
+# Marks a Service whose probe failed, so that it is not probed again
+_PROBE_FAILED = {}
+
+
+def _parse_endpoint(uri):
+    """
+    Helper function to split a Service URI into its host and port
+
+    :param uri: the Service URI (rosrpc://host:port)
+    :type uri: str
+    :return: the (host, port) of the Service, or None if the URI is
+        not a valid Service URI
+    :rtype: tuple(str, int)
+    """
+    if not uri.startswith('rosrpc://'):
+        return None
+    host, _, port = uri[len('rosrpc://'):].rstrip('/').rpartition(':')
+    try:
+        return host, int(port)
+    except ValueError:
+        return None
 
 
 class ServiceBuilder(_EntityBuilder):
@@ -33,6 +114,21 @@ class ServiceBuilder(_EntityBuilder):
     further populating itself from that information for the purpose
     of extracting a metamodel instance
     """
+    __slots__ = ('_headers', '_arguments', '_service_provider_node_names',
+                 '_filtered_service_provider_node_names', '_uri')
+
+    # (host, port) endpoints whose connection failed; their other
+    # Services are not probed
+    _unreachable_endpoints = set()
+
+    @classmethod
+    def clear_endpoint_caches(cls):
+        """
+        Forgets the resolved endpoint addresses and the endpoints marked
+        as unreachable, so that they are resolved and probed again
+        """
+        _RESOLVED_ADDRESSES.clear()
+        cls._unreachable_endpoints.clear()
 
     def __init__(self, name):
         """
@@ -43,9 +139,10 @@ class ServiceBuilder(_EntityBuilder):
         :type name: str
         """
         super(ServiceBuilder, self).__init__(name)
-        self._headers = dict()
+        self._headers = None
         self._arguments = None
         self._service_provider_node_names = set()
+        self._filtered_service_provider_node_names = None
         self._uri = None
         # self._exe = None
 
@@ -59,7 +156,7 @@ class ServiceBuilder(_EntityBuilder):
         """
         if self._uri is None:
             try:
-                self._uri = ROSUtilities.get_ros_utilities().master.lookupService(self.name)
+                self._uri = get_ros_utilities().master.lookupService(self.name)
             except rosgraph.masterapi.MasterError:
                 print "Service URI %s is unavailable " % self._name
                 self._uri = "Service URI %s is unavailable " % self._name
@@ -68,21 +165,41 @@ class ServiceBuilder(_EntityBuilder):
     @property
     def headers(self):
         """
-        Returns the Service's XML-RPC handshake headers
+        Returns the Service's XML-RPC handshake headers; the Service is
+        probed on first access and the result is kept, whether the
+        headers were received or the probe failed
 
-        :return: the Service's XML-RPC handshake headers
+        :return: the Service's XML-RPC handshake headers, or None if
+            the Service cannot be reached
         :rtype: {str: str}
         """
-        destination_address = self.uri[len('rosrpc://'):]
-        destination_address, destination_port = destination_address.split(':')
-        destination_port = int(destination_port)
+        if self._headers is not None:
+            return None if self._headers is _PROBE_FAILED else self._headers
+        self._headers = _PROBE_FAILED
+        endpoint = _parse_endpoint(self.uri)
+        unreachable_endpoints = ServiceBuilder._unreachable_endpoints
+        if endpoint is None or endpoint in unreachable_endpoints:
+            print 'Unable to communicate with service "{}" -> "{}"'.format(self.name, self.uri)
+            return None
+        my_socket = None
         try:
-            my_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            my_socket.settimeout(5.0)
-            my_socket.connect((destination_address, destination_port))
+            family, socket_address = _resolve_address(*endpoint)
+            my_socket = socket.socket(family, socket.SOCK_STREAM)
+            my_socket.settimeout(_CONNECT_TIMEOUT)
+            try:
+                my_socket.connect(socket_address)
+            except socket.timeout:
+                unreachable_endpoints.add(endpoint)
+                raise
+            except socket.error as ex:
+                if ex.errno in _UNREACHABLE_ERRNOS:
+                    unreachable_endpoints.add(endpoint)
+                raise
+            my_socket.settimeout(_HANDSHAKE_TIMEOUT)
             header = {'probe': '1', 'md5sum': '*', 'callerid': '/rosservice', 'service': self.name}
             rosgraph.network.write_ros_handshake_header(my_socket, header)
-            handshake_headers = rosgraph.network.read_ros_handshake_header(my_socket, BufferType(), 2048)
+            handshake_headers = rosgraph.network.read_ros_handshake_header(my_socket, _handshake_buffer(), 2048)
+            self._headers = handshake_headers
             return handshake_headers
         except socket.error:
             print 'Unable to communicate with service "{}" -> "{}"'.format(self.name, self.uri)
@@ -96,10 +213,14 @@ class ServiceBuilder(_EntityBuilder):
         """
         Returns the Service's ROS type
 
-        :return: the Service's ROS type
+        :return: the Service's ROS type, or None if the Service
+            cannot be reached
         :rtype: str
         """
-        return self.headers['type']
+        headers = self.headers
+        if headers is None:
+            return None
+        return headers.get('type')
 
     @property
     def service_provider_node_names(self):
@@ -108,10 +229,12 @@ class ServiceBuilder(_EntityBuilder):
         this Service
 
         :return: the names of the Service Provider ROS Nodes
-        :rtype: set{str}
+        :rtype: frozenset{str}
         """
-        node_filter = filters.NodeFilter.get_filter()
-        return set([name for name in self._service_provider_node_names if not node_filter.should_filter_out(name)])
+        if self._filtered_service_provider_node_names is None:
+            self._filtered_service_provider_node_names = frozenset(
+                self._service_provider_node_names.difference(filters.NodeFilter.get_filter().exclusion_set()))
+        return self._filtered_service_provider_node_names
 
     def add_service_provider_node_name(self, service_provider_node_name):
         """
@@ -123,6 +246,7 @@ class ServiceBuilder(_EntityBuilder):
         :type service_provider_node_name: str
         """
         self._service_provider_node_names.add(service_provider_node_name)
+        self._filtered_service_provider_node_names = None
 
     def extract_metamodel(self):
         """
@@ -132,10 +256,11 @@ class ServiceBuilder(_EntityBuilder):
         :return: the created / extracted metamodel instance
         :rtype: Service
         """
+        headers = self.headers
         service_metamodel = Service(source='ros_snapshot',
-                                    name=self.name,
+                                    name=self._name,
                                     uri=self.uri,
-                                    construct_type=self.construct_type,
-                                    headers=self.headers,
-                                    service_provider_node_names=self.service_provider_node_names)
+                                    construct_type=None if headers is None else headers.get('type'),
+                                    headers=headers,
+                                    service_provider_node_names=set(self.service_provider_node_names))
         return service_metamodel
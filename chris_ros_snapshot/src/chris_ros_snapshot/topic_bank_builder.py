@@ -37,6 +37,7 @@ class TopicBankBuilder(_BankBuilder):
         """
         super(TopicBankBuilder, self).__init__()
         self._topic_types = topic_types
+        self._topic_type_map = dict(topic_types)
 
     def _create_entity_builder(self, name):
         """
@@ -51,20 +52,18 @@ class TopicBankBuilder(_BankBuilder):
         topic_builder.construct_type = self._find_topic_type(topic_builder.name)
         return topic_builder
 
-    def _should_filter_out(self, name, entity_builder):
+    def _get_should_filter_out(self):
         """
-        Indicates whether the given TopicBuilder (which has a name to
-        identify it) should be filtered out or not
+        Returns the function that indicates whether a given TopicBuilder
+        (which has a name to identify it) should be filtered out or not;
+        the TopicFilter is looked up once, rather than per TopicBuilder
 
-        :param name: the name to identify the TopicBuilder
-        :type name: str
-        :param entity_builder: the TopicBuilder to check
-        :type entity_builder: TopicBuilder
-        :return: True if the TopicBuilder should be filtered out;
-            False if not
-        :rtype: bool
+        :return: a function of the name and the TopicBuilder that returns
+            True if the TopicBuilder should be filtered out; False if not
+        :rtype: function(str, TopicBuilder)
         """
-        return filters.TopicFilter.get_filter().should_filter_out(name)
+        should_filter_out = filters.TopicFilter.get_filter().should_filter_out
+        return lambda name, entity_builder: should_filter_out(name)
 
     def _find_topic_type(self, desired_topic):
         """
@@ -76,11 +75,7 @@ class TopicBankBuilder(_BankBuilder):
         :return: the name of the desired topic's type
         :rtype: str
         """
-        obtained_topic_type = 'Error: Unknown'
-        for topic, topic_type in self._topic_types:
-            if topic == desired_topic:
-                obtained_topic_type = topic_type
-        return obtained_topic_type
+        return self._topic_type_map.get(desired_topic, 'Error: Unknown')
 
     def _create_bank_metamodel(self):
         """
@@ -98,26 +93,28 @@ class TopicBankBuilder(_BankBuilder):
         removes TopicBuilders from the internal store that happen to be
         part of newly extracted and valid ActionBuilders
 
-        :return: a dictionary of action names to ActionBuilders
-        :rtype: dict{str: ActionBuilder}
+        :return: the valid ActionBuilders
+        :rtype: list[ActionBuilder]
         """
-        names_to_action_builders = dict()
+        names_to_action_builders = {}
         Logger.get_logger().log(LoggerLevel.INFO, 'Searching topics in topic bank for corresponding actions.')
-        for topic_builder in self.names_to_entity_builders.values():
+        for topic_builder in self.names_to_entity_builders.itervalues():
             if ActionBuilder.test_potential_action_topic_builder(topic_builder):
                 action_name = topic_builder.name_base
-                if action_name not in names_to_action_builders.keys():
-                    names_to_action_builders[action_name] = ActionBuilder(action_name)
-                names_to_action_builders[action_name].add_topic_builder(topic_builder)
-        for action_name, action_builder in dict(names_to_action_builders).items():
+                action_builder = names_to_action_builders.get(action_name)
+                if action_builder is None:
+                    action_builder = names_to_action_builders[action_name] = ActionBuilder(action_name)
+                action_builder.add_topic_builder(topic_builder)
+        action_builders = []
+        for action_name, action_builder in names_to_action_builders.iteritems():
             if not action_builder.validate_action_topic_builders():
                 log_message = 'Action {} NOT valid. Not removing topics from topic bank.'.format(action_name)
-                names_to_action_builders.pop(action_name)
             else:
                 log_message = 'Action {} is valid. Removing corresponding topics from topic bank.'.format(action_name)
                 self._remove_action_topic_builders(action_builder.topic_names_to_builders.values())
+                action_builders.append(action_builder)
             Logger.get_logger().log(LoggerLevel.INFO, log_message)
-        return names_to_action_builders
+        return action_builders
 
     def _remove_action_topic_builders(self, action_topic_builders):
         """
@@ -27,6 +27,7 @@ class TopicBuilder(_EntityBuilder):
     further populating itself from that information for the purpose
     of extracting a metamodel instance
     """
+    __slots__ = ('_construct_type', '_node_names', '_filtered_node_names')
 
     def __init__(self, name):
         """
@@ -39,6 +40,8 @@ class TopicBuilder(_EntityBuilder):
         super(TopicBuilder, self).__init__(name)
         self._construct_type = None
         self._node_names = {'published': set(), 'subscribed': set()}
+        # Filtered node names by status; None until computed
+        self._filtered_node_names = {'published': None, 'subscribed': None}
 
     @property
     def construct_type(self):
@@ -66,10 +69,9 @@ class TopicBuilder(_EntityBuilder):
         Returns the names of the ROS Nodes that have Published the Topic
 
         :return: the names of Publisher ROS Nodes for this Topic
-        :rtype: set{str}
+        :rtype: frozenset{str}
         """
-        node_filter = filters.NodeFilter.get_filter()
-        return set([name for name in self._node_names['published'] if not node_filter.should_filter_out(name)])
+        return self._get_filtered_node_names('published')
 
     @property
     def subscriber_node_names(self):
@@ -78,10 +80,28 @@ class TopicBuilder(_EntityBuilder):
         Topic
 
         :return: the names of Subscriber ROS Nodes for this Topic
-        :rtype: set{str}
+        :rtype: frozenset{str}
         """
-        node_filter = filters.NodeFilter.get_filter()
-        return set([name for name in self._node_names['subscribed'] if not node_filter.should_filter_out(name)])
+        return self._get_filtered_node_names('subscribed')
+
+    def _get_filtered_node_names(self, status):
+        """
+        Helper method to return the ROS Node names for a status that
+        pass the NodeFilter; the result is kept until another ROS Node
+        name is added for that status
+
+        :param status: the status or relationship ('published' or
+            'subscribed') between the Topic and the ROS Nodes
+        :type status: str
+        :return: the filtered ROS Node names
+        :rtype: frozenset{str}
+        """
+        filtered_node_names = self._filtered_node_names[status]
+        if filtered_node_names is None:
+            filtered_node_names = frozenset(
+                self._node_names[status].difference(filters.NodeFilter.get_filter().exclusion_set()))
+            self._filtered_node_names[status] = filtered_node_names
+        return filtered_node_names
 
     def add_node_name(self, node_name, status):
         """
@@ -95,6 +115,7 @@ class TopicBuilder(_EntityBuilder):
         :type status: str
         """
         self._node_names[status].add(node_name)
+        self._filtered_node_names[status] = None
 
     def extract_metamodel(self):
         """
@@ -104,9 +125,10 @@ class TopicBuilder(_EntityBuilder):
         :return: the created / extracted metamodel instance
         :rtype: Topic
         """
+        get_filtered_node_names = self._get_filtered_node_names
         topic_metamodel = Topic(source='ros_snapshot',
-                                name=self.name,
-                                construct_type=self.construct_type,
-                                publisher_node_names=self.publisher_node_names,
-                                subscriber_node_names=self.subscriber_node_names)
+                                name=self._name,
+                                construct_type=self._construct_type,
+                                publisher_node_names=set(get_filtered_node_names('published')),
+                                subscriber_node_names=set(get_filtered_node_names('subscribed')))
         return topic_metamodel
@@ -13,6 +13,8 @@ Demo of JointTrajectoryAction with RRBot Demo
 """
 import math
 
+import numpy as np
+
 import actionlib
 import roslib
 import rospy
@@ -35,13 +37,14 @@ def main(argv):
         goal.trajectory.joint_names.append("joint2")
         print goal.trajectory.joint_names
 
+        # 1 cycle
+        # Note: Action controller will add +/- 2pi based on position of arm
+        steps = np.arange(20)
+        joint1_positions = (math.pi/2)*np.cos(np.pi*steps/10)  # 1 cycle
+        joint2_positions = (math.pi/4)*np.cos(np.pi*steps/5)   # 2 cycles
         for i in range(0,20):
-            # 1 cycle
             point = JointTrajectoryPoint()
-
-            # Note: Action controller will add +/- 2pi based on position of arm
-            point.positions =[(math.pi/2)*math.cos(math.pi*i/10), # 1 cycle
-                              (math.pi/4)*math.cos(math.pi*i/5)]  # 2 cycles
+            point.positions =[float(joint1_positions[i]), float(joint2_positions[i])]
             point.time_from_start = rospy.Duration(i*0.5)         # 10 seconds loop
             goal.trajectory.points.append(point)
 